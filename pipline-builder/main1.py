@@ -10,13 +10,19 @@ import json
 import yaml
 import sqlite3
 import logging
+import os
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Iterable, Optional, Tuple
 from abc import ABC, abstractmethod
+from collections import Counter
 from dataclasses import dataclass, asdict
+from functools import lru_cache
 from pathlib import Path
+from string import Template
+import copy
 import pickle
 import re
+import hashlib
 from sklearn.ensemble import IsolationForest
 from sklearn.preprocessing import StandardScaler
 from sklearn.cluster import KMeans
@@ -24,10 +30,127 @@ from sklearn.linear_model import LinearRegression
 import warnings
 warnings.filterwarnings('ignore')
 
+try:
+    from cuml.ensemble import IsolationForest as GPUIsolationForest
+except ImportError:
+    GPUIsolationForest = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Column classification patterns, compiled once rather than per sampled value and matched
+# against whole values; dates may carry a time-of-day suffix
+_EMAIL_RE = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+_PHONE_RE = re.compile(r'\+?1?-?\.?\s?\(?[0-9]{3}\)?[\s.-]?[0-9]{3}[\s.-]?[0-9]{4}')
+_DATE_RE = re.compile(r'(?:\d{4}-\d{2}-\d{2}|\d{2}/\d{2}/\d{4}|\d{2}-\d{2}-\d{4})(?:[ T].*)?')
+
+# Recommendations for semantic column types, keyed by the type _classify_column_type assigns
+_TYPE_RECOMMENDATIONS = {
+    'email': "Column '{column}' contains emails. Consider email validation and privacy measures.",
+    'identifier': "Column '{column}' appears to be an identifier. Consider indexing for performance.",
+    'date': "Column '{column}' contains dates. Consider date parsing and time-based analysis."
+}
+
+# Recommendation text parsing: the quoted column of a null-percentage recommendation, and duplicate mentions
+_NULL_RECOMMENDATION_RE = re.compile(r"null percentage(?:[^']*'([^']*)')?", re.IGNORECASE)
+_DUPLICATE_RECOMMENDATION_RE = re.compile(r"duplicate", re.IGNORECASE)
+
+# Strings pandas.read_csv reads as missing by default, given to generated readers that would otherwise keep them
+_CSV_NA_VALUES = ['', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND', '1.#QNAN',
+                  '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null']
+
+# Characters replaced when a pipeline name is turned into a configuration file name
+_UNSAFE_FILENAME_RE = re.compile(r"[^A-Za-z0-9_-]+")
+
+# Row count above which anomaly detection runs on the GPU when cuML is installed
+GPU_ANOMALY_MIN_ROWS = 100_000
+
+# Leading CSV rows read to analyze a source when creating a pipeline; validation reads the full file
+ANALYSIS_SAMPLE_ROWS = 10_000
+
+# Rows per chunk when validating a CSV file without loading it whole
+VALIDATION_CHUNK_ROWS = 100_000
+
+# Row count above which models are fitted on a fixed-seed sample and then label every row
+FIT_SAMPLE_MAX_ROWS = 100_000
+
+# Leading rows of a chunked validation kept in memory for anomaly detection; the other
+# checks fold every chunk into running counts
+VALIDATION_ANOMALY_SAMPLE_ROWS = 100_000
+
+def _fit_sample(data: np.ndarray) -> np.ndarray:
+    """Rows to fit a model on: all of them, or a reproducible FIT_SAMPLE_MAX_ROWS sample"""
+    if len(data) <= FIT_SAMPLE_MAX_ROWS:
+        return data
+    idx = np.random.default_rng(42).choice(len(data), FIT_SAMPLE_MAX_ROWS, replace=False)
+    return data[np.sort(idx)]
+
+# Outlier labels of recent fits, so analysis and validation of the same data fit the forest once
+_OUTLIER_CACHE: Dict[Tuple[Any, ...], np.ndarray] = {}
+_OUTLIER_CACHE_SIZE = 8
+
+def _fit_predict_outliers(detector: Any, numeric_data: np.ndarray) -> np.ndarray:
+    """Label outlier rows (-1), reusing the labels of an identical earlier fit"""
+    key = (
+        type(detector).__name__,
+        repr(sorted(detector.get_params().items())),
+        numeric_data.shape,
+        numeric_data.dtype.str,
+        hashlib.blake2b(numeric_data, digest_size=16).digest()
+    )
+    if key not in _OUTLIER_CACHE:
+        if len(_OUTLIER_CACHE) >= _OUTLIER_CACHE_SIZE:
+            del _OUTLIER_CACHE[next(iter(_OUTLIER_CACHE))]
+        _OUTLIER_CACHE[key] = detector.fit(_fit_sample(numeric_data)).predict(numeric_data)
+    return _OUTLIER_CACHE[key]
+
+# cuML detector, created on first use above GPU_ANOMALY_MIN_ROWS; False once creating or fitting
+# it has failed (e.g. on a host without a CUDA device), so later calls go straight to the CPU
+_GPU_ANOMALY_DETECTOR: Any = None
+
+def _detect_outliers(cpu_detector: Any, numeric_data: np.ndarray) -> np.ndarray:
+    """Label outlier rows (-1), on the GPU for large inputs when cuML works and otherwise on the CPU"""
+    global _GPU_ANOMALY_DETECTOR
+    if GPUIsolationForest is not None and _GPU_ANOMALY_DETECTOR is not False and len(numeric_data) > GPU_ANOMALY_MIN_ROWS:
+        try:
+            if _GPU_ANOMALY_DETECTOR is None:
+                _GPU_ANOMALY_DETECTOR = GPUIsolationForest(contamination=0.1, random_state=42, output_type='numpy')
+            return _fit_predict_outliers(_GPU_ANOMALY_DETECTOR, numeric_data)
+        except Exception as e:
+            logger.warning(f"GPU anomaly detection unavailable, falling back to the CPU: {str(e)}")
+            _GPU_ANOMALY_DETECTOR = False
+    return _fit_predict_outliers(cpu_detector, numeric_data)
+
+# Analysis results keyed by frame content; callers get deep copies so they can't mutate an entry
+_ANALYSIS_CACHE: Dict[Tuple[Any, ...], Dict[str, Any]] = {}
+_ANALYSIS_CACHE_SIZE = 32
+
+def _frame_digest(df: pd.DataFrame) -> Optional[Tuple[Any, ...]]:
+    """Content key for a frame, or None when its values can't be hashed"""
+    try:
+        row_hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+    except TypeError:
+        return None
+    return (
+        df.shape,
+        tuple(map(str, df.columns)),
+        tuple(map(str, df.dtypes)),
+        hashlib.blake2b(row_hashes, digest_size=16).digest()
+    )
+
+def _dump_json(obj: Any) -> bytes:
+    """Indented JSON encoding, using the C-accelerated orjson when it is installed"""
+    # Both serializers write datetimes as ISO 8601 strings and stringify non-string keys
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, default=datetime.isoformat).encode()
+
 @dataclass
 class PipelineConfig:
     """Configuration for data pipeline"""
@@ -40,51 +163,129 @@ class PipelineConfig:
     schedule: str
     quality_checks: List[Dict[str, Any]]
     framework: str = "airflow"
+    engine: str = "pandas"
     created_at: datetime = None
     
     def __post_init__(self):
         if self.created_at is None:
             self.created_at = datetime.now()
+    
+    _cache_attrs = ('_json_cache', '_source_json', '_destination_json')
+    
+    def __setattr__(self, name: str, value: Any):
+        # Reassigning a field invalidates the cached JSON forms. In-place edits of the dict and
+        # list fields go unnoticed, so those fields are always replaced with a new object
+        object.__setattr__(self, name, value)
+        if name not in self._cache_attrs:
+            for cache_attr in self._cache_attrs:
+                object.__setattr__(self, cache_attr, None)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Dict form of the config, a fresh copy callers may modify"""
+        # Decoding the cached JSON in C is cheaper than asdict's recursive deep copy; only
+        # created_at needs restoring, as JSON holds it as a string
+        encoded = self.to_json_bytes()
+        data = orjson.loads(encoded) if orjson else json.loads(encoded)
+        data['created_at'] = self.created_at
+        return data
+    
+    def to_json_bytes(self) -> bytes:
+        """JSON encoding of the config, shared by the saved file and API responses"""
+        # Only immutable bytes are cached, so no caller can alter a cached form
+        if self._json_cache is None:
+            self._json_cache = _dump_json(asdict(self))
+        return self._json_cache
+    
+    @property
+    def source_config_json(self) -> str:
+        """Indented JSON of the source configuration, as shown in the documentation"""
+        if self._source_json is None:
+            self._source_json = _dump_json(self.source_config).decode()
+        return self._source_json
+    
+    @property
+    def destination_config_json(self) -> str:
+        """Indented JSON of the destination configuration, as shown in the documentation"""
+        if self._destination_json is None:
+            self._destination_json = _dump_json(self.destination_config).decode()
+        return self._destination_json
+
+@dataclass
+class NumericView:
+    """Numeric columns of a frame, extracted once and shared by the ML passes"""
+    frame: pd.DataFrame
+    arr: np.ndarray
+    null_mask: np.ndarray
+    
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> 'NumericView':
+        """Select the numeric columns and build their zero-filled float32 matrix"""
+        frame = df.select_dtypes(include=[np.number])
+        # float32 halves the memory traffic of the scaler, KMeans and IsolationForest without
+        # changing the flags. DataFrame.to_numpy hands back column-major data, which
+        # scikit-learn would copy again.
+        arr = np.ascontiguousarray(frame.fillna(0).to_numpy(dtype=np.float32, copy=False))
+        return cls(frame=frame, arr=arr, null_mask=frame.isnull().to_numpy())
 
 class AIDataAnalyzer:
     """AI-powered data analysis and pattern recognition"""
     
-    def __init__(self):
+    def __init__(self, return_full_corr_matrix: bool = False):
+        self.return_full_corr_matrix = return_full_corr_matrix
         self.scaler = StandardScaler()
-        self.anomaly_detector = IsolationForest(contamination=0.1, random_state=42)
-        self.pattern_model = KMeans(n_clusters=5, random_state=42)
+        self.anomaly_detector = IsolationForest(contamination=0.1, random_state=42, n_jobs=-1)
+        self.pattern_model = KMeans(n_clusters=5, random_state=42, n_init=1, algorithm='elkan')
         
     def analyze_data_patterns(self, df: pd.DataFrame) -> Dict[str, Any]:
         """Analyze data patterns using ML algorithms"""
+        digest = _frame_digest(df)
+        key = None if digest is None else (self.return_full_corr_matrix,) + digest
+        if key in _ANALYSIS_CACHE:
+            return copy.deepcopy(_ANALYSIS_CACHE[key])
+        
+        # Build the numeric view once and share it between the ML passes
+        numeric = NumericView.from_frame(df)
+        
         analysis_results = {
             'data_quality': self._assess_data_quality(df),
             'column_types': self._infer_column_types(df),
-            'patterns': self._detect_patterns(df),
-            'anomalies': self._detect_anomalies(df),
-            'correlations': self._analyze_correlations(df),
+            'patterns': self._detect_patterns(numeric),
+            'anomalies': self._detect_anomalies(numeric),
+            'correlations': self._analyze_correlations(numeric),
             'recommendations': []
         }
         
         # Generate AI recommendations
         analysis_results['recommendations'] = self._generate_recommendations(analysis_results, df)
         
+        if key is not None:
+            if len(_ANALYSIS_CACHE) >= _ANALYSIS_CACHE_SIZE:
+                del _ANALYSIS_CACHE[next(iter(_ANALYSIS_CACHE))]
+            _ANALYSIS_CACHE[key] = copy.deepcopy(analysis_results)
+        
         return analysis_results
     
     def _assess_data_quality(self, df: pd.DataFrame) -> Dict[str, Any]:
         """Assess data quality metrics"""
-        quality_metrics = {}
-        
-        for column in df.columns:
-            quality_metrics[column] = {
-                'null_percentage': df[column].isnull().sum() / len(df) * 100,
-                'unique_values': df[column].nunique(),
-                'data_type': str(df[column].dtype),
-                'completeness': (len(df) - df[column].isnull().sum()) / len(df) * 100
+        # Compute each metric for all columns in one call rather than column by column
+        n = len(df)
+        null_percentages = df.isnull().sum() / n * 100
+        unique_values = df.nunique(dropna=True)
+        dtypes = df.dtypes.astype(str)
+        
+        quality_metrics = {
+            column: {
+                'null_percentage': null_percentages[column],
+                'unique_values': unique_values[column],
+                'data_type': dtypes[column],
+                'completeness': 100 - null_percentages[column]
             }
-            
-            # Check for duplicates
-            if df[column].dtype in ['object', 'string']:
-                quality_metrics[column]['duplicate_percentage'] = df[column].duplicated().sum() / len(df) * 100
+            for column in df.columns
+        }
+        
+        # Check for duplicates
+        for column in df.select_dtypes(include=['object', 'string']).columns:
+            quality_metrics[column]['duplicate_percentage'] = df[column].duplicated().sum() / n * 100
                 
         return quality_metrics
     
@@ -93,28 +294,27 @@ class AIDataAnalyzer:
         column_types = {}
         
         for column in df.columns:
-            sample_values = df[column].dropna().astype(str).head(100).tolist()
+            # Only the first few non-null values are classified, so convert just those to strings
+            sample_values = df[column].dropna().head(10).astype(str)
             column_types[column] = self._classify_column_type(column, sample_values)
             
         return column_types
     
-    def _classify_column_type(self, column_name: str, sample_values: List[str]) -> str:
+    def _classify_column_type(self, column_name: str, sample_values: pd.Series) -> str:
         """Classify column type using pattern matching and AI"""
         column_lower = column_name.lower()
+        samples = sample_values.head(10).str
         
         # Email pattern
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if any(re.match(email_pattern, val) for val in sample_values[:10]):
+        if samples.fullmatch(_EMAIL_RE, na=False).any():
             return 'email'
             
         # Phone pattern
-        phone_pattern = r'^\+?1?-?\.?\s?\(?[0-9]{3}\)?[\s.-]?[0-9]{3}[\s.-]?[0-9]{4}$'
-        if any(re.match(phone_pattern, val) for val in sample_values[:10]):
+        if samples.fullmatch(_PHONE_RE, na=False).any():
             return 'phone'
             
         # Date pattern
-        date_patterns = [r'\d{4}-\d{2}-\d{2}', r'\d{2}/\d{2}/\d{4}', r'\d{2}-\d{2}-\d{4}']
-        if any(any(re.match(pattern, val) for pattern in date_patterns) for val in sample_values[:10]):
+        if samples.fullmatch(_DATE_RE, na=False).any():
             return 'date'
             
         # ID patterns
@@ -131,72 +331,85 @@ class AIDataAnalyzer:
             
         return 'generic'
     
-    def _detect_patterns(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _detect_patterns(self, numeric: NumericView) -> Dict[str, Any]:
         """Detect data patterns using ML"""
         patterns = {}
+        numeric_data = numeric.arr
         
-        numeric_columns = df.select_dtypes(include=[np.number]).columns
-        if len(numeric_columns) > 0:
-            numeric_data = df[numeric_columns].fillna(0)
-            
+        if numeric_data.shape[1] > 0:
             if len(numeric_data) > 0:
                 # Clustering to find patterns
                 try:
-                    scaled_data = self.scaler.fit_transform(numeric_data)
-                    clusters = self.pattern_model.fit_predict(scaled_data)
+                    fit_data = _fit_sample(numeric_data)
+                    scaled_data = self.scaler.fit(fit_data).transform(numeric_data)
+                    if fit_data is numeric_data:
+                        clusters = self.pattern_model.fit_predict(scaled_data)
+                    else:
+                        clusters = self.pattern_model.fit(self.scaler.transform(fit_data)).predict(scaled_data)
+                    # Labels lie in [0, n_clusters), so one bincount pass tallies them without sorting
+                    counts = np.bincount(clusters, minlength=self.pattern_model.n_clusters)
                     patterns['clusters'] = {
-                        'n_clusters': len(np.unique(clusters)),
-                        'cluster_sizes': dict(zip(*np.unique(clusters, return_counts=True)))
+                        'n_clusters': int((counts > 0).sum()),
+                        'cluster_sizes': {i: int(c) for i, c in enumerate(counts) if c}
                     }
                 except:
                     patterns['clusters'] = {'error': 'Could not perform clustering'}
                     
         return patterns
     
-    def _detect_anomalies(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _detect_anomalies(self, numeric: NumericView) -> Dict[str, Any]:
         """Detect anomalies using Isolation Forest"""
         anomalies = {}
+        numeric_data = numeric.arr
         
-        numeric_columns = df.select_dtypes(include=[np.number]).columns
-        if len(numeric_columns) > 0:
-            numeric_data = df[numeric_columns].fillna(0)
-            
+        if numeric_data.shape[1] > 0:
             if len(numeric_data) > 10:  # Need sufficient data for anomaly detection
                 try:
-                    outliers = self.anomaly_detector.fit_predict(numeric_data)
+                    outliers = _detect_outliers(self.anomaly_detector, numeric_data)
                     anomaly_count = np.sum(outliers == -1)
                     anomalies['numeric_anomalies'] = {
                         'count': int(anomaly_count),
-                        'percentage': float(anomaly_count / len(df) * 100)
+                        'percentage': float(anomaly_count / len(numeric_data) * 100)
                     }
                 except:
                     anomalies['numeric_anomalies'] = {'error': 'Could not detect anomalies'}
                     
         return anomalies
     
-    def _analyze_correlations(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _analyze_correlations(self, numeric: NumericView) -> Dict[str, Any]:
         """Analyze correlations between numeric columns"""
-        numeric_df = df.select_dtypes(include=[np.number])
-        
+        numeric_df = numeric.frame
         if len(numeric_df.columns) > 1:
-            corr_matrix = numeric_df.corr()
+            if numeric.null_mask.any():
+                # Only DataFrame.corr drops missing values pair by pair
+                corr_matrix = numeric_df.corr()
+            else:
+                # Without nulls the whole matrix is a single BLAS-backed np.corrcoef call
+                corr_matrix = pd.DataFrame(
+                    np.corrcoef(numeric_df.to_numpy(dtype=np.float64), rowvar=False),
+                    index=numeric_df.columns, columns=numeric_df.columns
+                )
             
-            # Find strong correlations
-            strong_correlations = []
-            for i in range(len(corr_matrix.columns)):
-                for j in range(i+1, len(corr_matrix.columns)):
-                    corr_value = corr_matrix.iloc[i, j]
-                    if abs(corr_value) > 0.7:  # Strong correlation threshold
-                        strong_correlations.append({
-                            'column1': corr_matrix.columns[i],
-                            'column2': corr_matrix.columns[j],
-                            'correlation': float(corr_value)
-                        })
+            # Find strong correlations in the upper triangle, indexing only the hits
+            values = corr_matrix.to_numpy()
+            rows, cols = np.nonzero(np.triu(np.abs(values) > 0.7, k=1))  # Strong correlation threshold
+            columns = corr_matrix.columns.to_numpy()
+            strong_correlations = [
+                {
+                    'column1': columns[i],
+                    'column2': columns[j],
+                    'correlation': float(values[i, j])
+                }
+                for i, j in zip(rows.tolist(), cols.tolist())
+            ]
                         
-            return {
-                'strong_correlations': strong_correlations,
-                'correlation_matrix': corr_matrix.to_dict()
-            }
+            correlations = {'strong_correlations': strong_correlations}
+            
+            # The full matrix grows quadratically with the column count, so it is opt-in
+            if self.return_full_corr_matrix:
+                correlations['correlation_matrix'] = corr_matrix.to_dict('split')
+            
+            return correlations
             
         return {'correlations': 'Insufficient numeric columns for correlation analysis'}
     
@@ -204,24 +417,27 @@ class AIDataAnalyzer:
         """Generate AI-powered recommendations"""
         recommendations = []
         
-        # Data quality recommendations
+        # Data quality recommendations, visiting only the columns over a threshold
         quality_data = analysis['data_quality']
-        for column, metrics in quality_data.items():
-            if metrics['null_percentage'] > 20:
-                recommendations.append(f"High null percentage ({metrics['null_percentage']:.1f}%) in column '{column}'. Consider imputation or removal.")
+        if quality_data:
+            quality_df = pd.DataFrame.from_dict(quality_data, orient='index')
+            null_percentages = quality_df['null_percentage']
+            duplicate_percentages = quality_df.get('duplicate_percentage', pd.Series(np.nan, index=quality_df.index))
+            high_null = null_percentages > 20
+            high_duplicate = duplicate_percentages.fillna(0) > 10
+            for column in quality_df.index[high_null | high_duplicate]:
+                if high_null[column]:
+                    recommendations.append(f"High null percentage ({null_percentages[column]:.1f}%) in column '{column}'. Consider imputation or removal.")
                 
-            if 'duplicate_percentage' in metrics and metrics['duplicate_percentage'] > 10:
-                recommendations.append(f"High duplicate percentage ({metrics['duplicate_percentage']:.1f}%) in column '{column}'. Consider deduplication.")
+                if high_duplicate[column]:
+                    recommendations.append(f"High duplicate percentage ({duplicate_percentages[column]:.1f}%) in column '{column}'. Consider deduplication.")
         
         # Type-based recommendations
         column_types = analysis['column_types']
         for column, col_type in column_types.items():
-            if col_type == 'email':
-                recommendations.append(f"Column '{column}' contains emails. Consider email validation and privacy measures.")
-            elif col_type == 'identifier':
-                recommendations.append(f"Column '{column}' appears to be an identifier. Consider indexing for performance.")
-            elif col_type == 'date':
-                recommendations.append(f"Column '{column}' contains dates. Consider date parsing and time-based analysis.")
+            template = _TYPE_RECOMMENDATIONS.get(col_type)
+            if template:
+                recommendations.append(template.format(column=column))
         
         # Correlation recommendations
         if 'strong_correlations' in analysis['correlations']:
@@ -236,212 +452,339 @@ class AIDataAnalyzer:
         
         return recommendations
 
-class PipelineGenerator:
-    """AI-powered pipeline code generation"""
-    
-    def __init__(self):
-        self.templates = self._load_templates()
-    
-    def _load_templates(self) -> Dict[str, str]:
-        """Load code templates for different frameworks"""
-        return {
-            'airflow_dag': '''from airflow import DAG
+# Code templates for the supported frameworks
+_TEMPLATES: Dict[str, Template] = {
+    'airflow_dag': Template('''from airflow import DAG
 from airflow.operators.python_operator import PythonOperator
 from airflow.operators.bash_operator import BashOperator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 import logging
+import os
 
-default_args = {{
+# Tasks hand off Parquet paths through XCom, never the DataFrames themselves
+STAGE_DIR = '/tmp/dataops/${pipeline_name}'
+
+logger = logging.getLogger(__name__)
+
+START_DATE = datetime(2024, 1, 1)
+RETRY_DELAY = timedelta(minutes=5)
+
+default_args = {
     'owner': 'dataops-ai',
     'depends_on_past': False,
-    'start_date': datetime(2024, 1, 1),
+    'start_date': START_DATE,
     'email_on_failure': True,
     'email_on_retry': False,
     'retries': 1,
-    'retry_delay': timedelta(minutes=5),
-}}
+    'retry_delay': RETRY_DELAY,
+}
 
 dag = DAG(
-    '{pipeline_name}',
+    '${pipeline_name}',
     default_args=default_args,
-    description='{description}',
-    schedule_interval='{schedule}',
+    description='${description}',
+    schedule_interval='${schedule}',
     catchup=False,
     tags=['ai-generated', 'dataops'],
 )
 
-def extract_data(**context):
-    """Extract data from source"""
-    {extract_code}
+def _stage_path(name, context, ext=".parquet"):
+    """Return the path a task's output is staged at for this run and partition"""
+    index = context["task_instance"].map_index
+    if index >= 0:
+        name = f"{name}_{index}"
+    path = os.path.join(STAGE_DIR, context["run_id"], f"{name}{ext}")
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    return path
 
-def transform_data(**context):
-    """Transform data using AI recommendations"""
-    {transform_code}
+def _stage(data, name, context):
+    """Write a task's output (DataFrame or Arrow table) to Parquet and return its path"""
+    path = _stage_path(name, context)
+    if isinstance(data, pd.DataFrame):
+        data = pa.Table.from_pandas(data, preserve_index=False)
+    pq.write_table(data, path, compression="zstd", compression_level=3)
+    return path
 
-def validate_data(**context):
-    """Validate data quality"""
-    {validation_code}
+def _load(path, columns=None):
+    """Read a staged Parquet file or partition directory into Arrow-backed columns"""
+    # Memory-map the file so column pages are decoded straight from the page cache
+    return pd.read_parquet(path, engine="pyarrow", columns=columns, dtype_backend="pyarrow", memory_map=True)
+${validation_helpers}${load_helpers}${list_files_code}
+def extract_data(${task_args}**context):
+    """Extract data from source"""
+${extract_code}
+
+def transform_and_validate(${task_args}**context):
+    """Transform data using AI recommendations and validate its quality in one pass"""
+${transform_validate_code}
 
-def load_data(**context):
+def load_data(${task_args}**context):
     """Load data to destination"""
-    {load_code}
+${load_code}
 
-# Define tasks
+${task_definitions}
+'''),
+    'airflow_tasks': Template('''# Define tasks
 extract_task = PythonOperator(
     task_id='extract_data',
     python_callable=extract_data,
     dag=dag,
 )
 
-transform_task = PythonOperator(
-    task_id='transform_data',
-    python_callable=transform_data,
-    dag=dag,
-)
-
-validate_task = PythonOperator(
-    task_id='validate_data',
-    python_callable=validate_data,
+transform_validate_task = PythonOperator(
+    task_id='transform_and_validate',
+    python_callable=transform_and_validate,
     dag=dag,
 )
 
+# Retry transient destination failures on the load alone, without rerunning extract and transform
 load_task = PythonOperator(
     task_id='load_data',
     python_callable=load_data,
+    retries=3,
+    retry_exponential_backoff=True,
+    max_retry_delay=timedelta(minutes=30),
     dag=dag,
 )
 
 # Set task dependencies
-extract_task >> transform_task >> validate_task >> load_task
-''',
-            'dbt_model': '''-- AI-Generated dbt model for {pipeline_name}
--- Generated on: {timestamp}
+extract_task >> transform_validate_task >> load_task'''),
+    'airflow_mapped_tasks': Template('''# Define tasks, mapping one task instance per input file
+list_files_task = PythonOperator(
+    task_id='list_files',
+    python_callable=list_files,
+    dag=dag,
+)
 
-{{{{ config(
+extract_task = PythonOperator.partial(
+    task_id='extract_data',
+    python_callable=extract_data,
+    dag=dag,
+).expand(op_args=list_files_task.output.map(lambda path: [path]))
+
+transform_validate_task = PythonOperator.partial(
+    task_id='transform_and_validate',
+    python_callable=transform_and_validate,
+    dag=dag,
+).expand(op_args=extract_task.output.map(lambda path: [path]))
+
+# Cap concurrent loads across all workers, which bounds the connections they open on the
+# destination (each worker process has its own engine pool), and retry transient
+# destination failures without rerunning extract and transform
+load_task = PythonOperator.partial(
+    task_id='load_data',
+    python_callable=load_data,
+    max_active_tis_per_dag=4,
+    retries=3,
+    retry_exponential_backoff=True,
+    max_retry_delay=timedelta(minutes=30),
+    dag=dag,
+).expand(op_args=transform_validate_task.output.map(lambda path: [path]))${swap_task}'''),
+    'dbt_model': Template('''-- AI-Generated dbt model for ${pipeline_name}
+-- Generated on: ${timestamp}
+
+{{ config(
     materialized='table',
     tags=['ai-generated', 'dataops']
-) }}}}
+) }}
 
 WITH source_data AS (
     SELECT *
-    FROM {{{{ source('{source_schema}', '{source_table}') }}}}
+    FROM {{ source('${source_schema}', '${source_table}') }}
 ),
 
 cleaned_data AS (
     SELECT
-        {select_columns}
+        ${select_columns}
     FROM source_data
-    WHERE {where_conditions}
+    WHERE ${where_conditions}
 ),
 
 transformed_data AS (
     SELECT
         *,
-        {transformations}
+        ${transformations}
     FROM cleaned_data
 )
 
 SELECT * FROM transformed_data
 
 -- Data quality tests will be generated separately
-''',
-            'prefect_flow': '''from prefect import flow, task
+'''),
+    'prefect_flow': Template('''from prefect import flow, task
+from prefect.runtime import flow_run
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 from datetime import datetime
+from functools import lru_cache
 import logging
+import os
+
+# Tasks hand off Parquet paths as return values, never the DataFrames themselves
+STAGE_DIR = '/tmp/dataops/${pipeline_name_clean}'
 
+logger = logging.getLogger(__name__)
+
+def _stage_path(name, context, ext=".parquet"):
+    """Return the path a task's output is staged at for this flow run"""
+    path = os.path.join(STAGE_DIR, context["run_id"], f"{name}{ext}")
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    return path
+
+def _stage(data, name, context):
+    """Write a task's output (DataFrame or Arrow table) to Parquet and return its path"""
+    path = _stage_path(name, context)
+    if isinstance(data, pd.DataFrame):
+        data = pa.Table.from_pandas(data, preserve_index=False)
+    pq.write_table(data, path, compression="zstd", compression_level=3)
+    return path
+
+def _load(path, columns=None):
+    """Read a staged Parquet file or partition directory into Arrow-backed columns"""
+    # Memory-map the file so column pages are decoded straight from the page cache
+    return pd.read_parquet(path, engine="pyarrow", columns=columns, dtype_backend="pyarrow", memory_map=True)
+${validation_helpers}${load_helpers}
 @task(name="extract_data")
-def extract_data():
+def extract_data(context):
     """Extract data from source"""
-    {extract_code}
+${extract_code}
 
 @task(name="transform_data")
-def transform_data(data):
+def transform_data(path, context):
     """Transform data using AI recommendations"""
-    {transform_code}
+    df = _load(path)
+${transform_code}
+    return _stage(df, "transform", context)
 
 @task(name="validate_data")
-def validate_data(data):
+def validate_data(path):
     """Validate data quality"""
-    {validation_code}
+    df = _load(path)
+${validation_code}
+    return path
 
 @task(name="load_data")
-def load_data(data):
+def load_data(path):
     """Load data to destination"""
-    {load_code}
+${load_code}
 
-@flow(name="{pipeline_name}")
-def {pipeline_name_clean}_flow():
-    """AI-generated Prefect flow for {description}"""
+@flow(name="${pipeline_name}")
+def ${pipeline_name_clean}_flow():
+    """AI-generated Prefect flow for ${description}"""
+    context = {"run_id": flow_run.get_id() or datetime.now().strftime("%Y%m%dT%H%M%S")}
     
     # Extract
-    raw_data = extract_data()
+    raw_path = extract_data(context)
     
     # Transform
-    transformed_data = transform_data(raw_data)
+    transformed_path = transform_data(raw_path, context)
     
     # Validate
-    validated_data = validate_data(transformed_data)
+    validated_path = validate_data(transformed_path)
     
     # Load
-    load_data(validated_data)
+    load_data(validated_path)
     
     return "Pipeline completed successfully"
 
 if __name__ == "__main__":
-    {pipeline_name_clean}_flow()
-'''
-        }
+    ${pipeline_name_clean}_flow()
+''')
+}
+
+class PipelineGenerator:
+    """AI-powered pipeline code generation"""
+    
+    def __init__(self):
+        self.templates = _TEMPLATES
     
     def generate_pipeline_code(self, config: PipelineConfig, analysis: Dict[str, Any]) -> Dict[str, str]:
         """Generate pipeline code based on configuration and AI analysis"""
         generated_code = {}
         
+        engine = config.engine.lower()
+        
+        # Glob patterns in an Airflow pandas CSV source fan out into one mapped task per file;
+        # the DuckDB and Polars readers expand globs themselves
+        file_path = config.source_config.get('file_path', '')
+        partitioned = (config.framework.lower() == 'airflow' and engine == 'pandas'
+                       and config.source_type.lower() == 'csv' and any(c in file_path for c in '*?['))
+        
         # Generate extraction code
-        extract_code = self._generate_extract_code(config.source_type, config.source_config)
+        extract_code = self._generate_extract_code(config.source_type, config.source_config, engine, analysis, partitioned)
         
         # Generate transformation code based on AI recommendations
         transform_code = self._generate_transform_code(config.transformations, analysis)
         
         # Generate validation code based on AI analysis
         validation_code = self._generate_validation_code(config.quality_checks, analysis)
+        # Prefect always validates with the pandas snippets, whatever the engine
+        uses_pandas = engine == 'pandas' or config.framework.lower() == 'prefect'
+        jit = uses_pandas and self._has_integer_identifier(analysis)
+        validation_helpers = self._generate_validation_helpers(analysis, jit) if uses_pandas else ''
         
         # Generate load code
-        load_code = self._generate_load_code(config.destination_type, config.destination_config)
+        load_code = self._generate_load_code(config.destination_type, config.destination_config, partitioned, config.framework)
+        load_helpers = self._generate_load_helpers(config.destination_type, config.destination_config, config.framework)
         
         # Clean pipeline name for Python identifiers
         pipeline_name_clean = config.name.replace(' ', '_').replace('-', '_').lower()
         
         # Generate framework-specific code
         if config.framework.lower() == 'airflow':
-            generated_code['dag.py'] = self.templates['airflow_dag'].format(
+            if engine == 'duckdb':
+                transform_validate_code = self._generate_duckdb_code(config.transformations, config.quality_checks, analysis)
+            elif engine == 'polars':
+                transform_validate_code = self._generate_polars_code(config.transformations, config.quality_checks, analysis)
+            else:
+                transform_validate_code = '\n'.join([
+                    'df = _load(path)' if partitioned else 'df = _load(context["task_instance"].xcom_pull(task_ids="extract_data"))',
+                    transform_code,
+                    validation_code,
+                    'return _stage(tbl, "transform", context)'
+                ])
+            generated_code['dag.py'] = self.templates['airflow_dag'].substitute(
                 pipeline_name=pipeline_name_clean,
                 description=f"AI-generated pipeline for {config.name}",
                 schedule=config.schedule,
                 extract_code=self._indent_code(extract_code, 4),
-                transform_code=self._indent_code(transform_code, 4),
-                validation_code=self._indent_code(validation_code, 4),
-                load_code=self._indent_code(load_code, 4)
+                transform_validate_code=self._indent_code(transform_validate_code, 4),
+                load_code=self._indent_code(load_code, 4),
+                validation_helpers=validation_helpers,
+                load_helpers=load_helpers,
+                list_files_code=self._generate_list_files_code(file_path) + self._generate_swap_code(config.destination_type, config.destination_config) if partitioned else '',
+                task_args='path, ' if partitioned else '',
+                task_definitions=self._generate_task_definitions(config.destination_type, partitioned)
             )
         elif config.framework.lower() == 'dbt':
             generated_code['model.sql'] = self._generate_dbt_model(config, analysis)
         elif config.framework.lower() == 'prefect':
-            generated_code['flow.py'] = self.templates['prefect_flow'].format(
+            generated_code['flow.py'] = self.templates['prefect_flow'].substitute(
                 pipeline_name=config.name,
                 pipeline_name_clean=pipeline_name_clean,
                 description=f"AI-generated pipeline for {config.name}",
                 extract_code=self._indent_code(extract_code, 4),
                 transform_code=self._indent_code(transform_code, 4),
                 validation_code=self._indent_code(validation_code, 4),
-                load_code=self._indent_code(load_code, 4)
+                load_code=self._indent_code(load_code, 4),
+                validation_helpers=validation_helpers,
+                load_helpers=load_helpers
             )
         
         # Generate requirements.txt
-        generated_code['requirements.txt'] = self._generate_requirements(config.framework)
+        generated_code['requirements.txt'] = self._generate_requirements(config.framework, engine, jit=jit)
         
         # Generate configuration files
-        generated_code['config.yaml'] = yaml.dump(asdict(config), default_flow_style=False)
+        generated_code['config.yaml'] = yaml.dump(config.to_dict(), default_flow_style=False)
         
         return generated_code
     
@@ -451,9 +794,116 @@ if __name__ == "__main__":
         indented_lines = [' ' * spaces + line if line.strip() else line for line in lines]
         return '\n'.join(indented_lines)
     
-    def _generate_extract_code(self, source_type: str, source_config: Dict[str, Any]) -> str:
+    def _source_schema(self, source_config: Dict[str, Any], analysis: Dict[str, Any]) -> Tuple[List[str], Dict[str, str]]:
+        """Pick the source columns to read and the Arrow-backed dtypes to parse them into"""
+        # The dtypes come from the analysis sample, so they are widened until any later row parses:
+        # integers to int64 (exact for identifiers past 2**53, and nullable in Arrow), floats to
+        # double and everything else to string
+        arrow_types = {
+            'int8': 'int64', 'int16': 'int64', 'int32': 'int64', 'int64': 'int64',
+            'Int8': 'int64', 'Int16': 'int64', 'Int32': 'int64', 'Int64': 'int64',
+            'float32': 'double', 'float64': 'double'
+        }
+        data_quality = analysis.get('data_quality', {})
+        columns = source_config.get('columns') or list(data_quality)
+        schema = {}
+        for column in columns:
+            if column in data_quality:
+                data_type = data_quality[column].get('data_type')
+                schema[column] = f"{arrow_types.get(data_type, 'string')}[pyarrow]"
+        return columns, schema
+    
+    def _generate_task_definitions(self, dest_type: str, partitioned: bool) -> str:
+        """Generate the Airflow operators and their dependencies"""
+        if not partitioned:
+            return self.templates['airflow_tasks'].substitute()
+        
+        swap_task = ''
+        if dest_type.lower() == 'postgresql':
+            swap_task = '''
+
+# Replace the target once every partition is staged
+swap_task = PythonOperator(
+    task_id='swap_table',
+    python_callable=swap_table,
+    op_args=[load_task.output],
+    retries=3,
+    retry_exponential_backoff=True,
+    dag=dag,
+)'''
+        return self.templates['airflow_mapped_tasks'].substitute(swap_task=swap_task)
+    
+    def _generate_swap_code(self, dest_type: str, dest_config: Dict[str, Any]) -> str:
+        """Generate the task swapping the partitions staged by the mapped loads into the target"""
+        if dest_type.lower() != 'postgresql':
+            return ''
+        
+        table = dest_config.get("table", "processed_data")
+        return f'''
+def swap_table(stages, **context):
+    """Combine this run's partition stage tables and swap them in for the target in one transaction"""
+    from sqlalchemy import inspect
+
+    stages = list(stages)
+    with _engine().begin() as conn:
+        conn.exec_driver_sql("DROP TABLE IF EXISTS {table}_stage")
+        if inspect(conn).has_table("{table}"):
+            # Copy the target's constraints, indexes and defaults so the swap keeps them
+            conn.exec_driver_sql("CREATE TABLE {table}_stage (LIKE {table} INCLUDING ALL)")
+            columns = ', '.join('"' + column["name"].replace('"', '""') + '"' for column in inspect(conn).get_columns(stages[0]))
+            conn.exec_driver_sql(f"INSERT INTO {table}_stage ({{columns}}) " + " UNION ALL ".join(f"SELECT {{columns}} FROM {{stage}}" for stage in stages))
+        else:
+            conn.exec_driver_sql("CREATE TABLE {table}_stage AS " + " UNION ALL ".join(f"SELECT * FROM {{stage}}" for stage in stages))
+        for stage in stages:
+            conn.exec_driver_sql(f"DROP TABLE {{stage}}")
+        conn.exec_driver_sql("DROP TABLE IF EXISTS {table}_old")
+        conn.exec_driver_sql("ALTER TABLE IF EXISTS {table} RENAME TO {table}_old")
+        conn.exec_driver_sql("ALTER TABLE {table}_stage RENAME TO {table}")
+    logger.info("Swapped %d partitions into {table}", len(stages))
+'''
+    
+    def _generate_list_files_code(self, pattern: str) -> str:
+        """Generate the task listing the input files matched by a glob pattern"""
+        return f'''
+def list_files(**context):
+    """List the input files, one mapped task instance each"""
+    import glob
+
+    files = sorted(glob.glob({pattern!r}))
+    logger.info("Found %d input files", len(files))
+    return files
+'''
+    
+    def _generate_extract_code(self, source_type: str, source_config: Dict[str, Any], engine: str = 'pandas', analysis: Dict[str, Any] = None, partitioned: bool = False) -> str:
         """Generate extraction code based on source type"""
-        if source_type.lower() == 'postgresql':
+        columns, schema = self._source_schema(source_config, analysis or {})
+        if source_type.lower() == 'csv' and engine == 'duckdb':
+            select_list = ', '.join('"' + column.replace('"', '""') + '"' for column in source_config.get('columns', [])) or '*'
+            copy_sql = f"COPY (SELECT {select_list} FROM read_csv_auto(?)) TO "
+            return f'''import duckdb
+
+# Convert the file straight to Parquet without materializing it in pandas. The source path is
+# bound as a parameter; COPY's target can't be, so its quotes are escaped instead
+path = _stage_path("extract", context)
+sql = {copy_sql!r} + "'" + path.replace("'", "''") + "' (FORMAT PARQUET, COMPRESSION ZSTD)"
+rows = duckdb.execute(sql, [{source_config.get('file_path', '')!r}]).fetchone()[0]
+logger.info("Extracted %d rows from CSV", rows)
+return path'''
+        elif source_type.lower() == 'csv' and engine == 'polars':
+            polars_types = {
+                'int8': 'pl.Int8', 'int16': 'pl.Int16', 'int32': 'pl.Int32', 'int64': 'pl.Int64',
+                'float': 'pl.Float32', 'double': 'pl.Float64', 'bool': 'pl.Boolean', 'string': 'pl.String'
+            }
+            overrides = ', '.join(f"{column!r}: {polars_types[dtype.split('[')[0]]}" for column, dtype in schema.items())
+            select = f".select({columns!r})" if columns else ""
+            return f'''import polars as pl
+
+# Stream the file to Parquet through a lazy scan without materializing it
+path = _stage_path("extract", context)
+pl.scan_csv('{source_config.get('file_path', '')}', schema_overrides={{{overrides}}}){select}.sink_parquet(path, compression="zstd")
+logger.info("Extracted CSV to %s", path)
+return path'''
+        elif source_type.lower() == 'postgresql':
             return f'''import psycopg2
 import pandas as pd
 
@@ -464,17 +914,48 @@ conn = psycopg2.connect(
     password="{source_config.get('password', '')}"
 )
 
+# Stream the result set into Parquet partitions instead of one DataFrame
+stage_dir = _stage_path("extract", context, ext="")
+os.makedirs(stage_dir, exist_ok=True)
+rows = 0
 query = "{source_config.get('query', 'SELECT * FROM table')}"
-df = pd.read_sql(query, conn)
+for i, chunk in enumerate(pd.read_sql(query, conn, chunksize=100_000, dtype_backend="pyarrow")):
+    chunk.to_parquet(os.path.join(stage_dir, f"{{i}}.parquet"), compression="zstd", index=False)
+    rows += len(chunk)
 conn.close()
-logging.info(f"Extracted {{len(df)}} rows from PostgreSQL")
-return df'''
+logger.info("Extracted %d rows from PostgreSQL", rows)
+return stage_dir'''
         elif source_type.lower() == 'csv':
-            return f'''import pandas as pd
+            path_option = "" if partitioned else f"path = \"{source_config.get('file_path', '')}\"\n"
+            arrow_schema = {column: dtype.split('[')[0] for column, dtype in schema.items()}
+            column_options = f"columns = {columns!r}\nschema = {arrow_schema!r}\n" if columns else ""
+            # Read the same strings as null that pandas.read_csv would, string columns included
+            convert_options = "null_values=NA_VALUES, strings_can_be_null=True"
+            if columns:
+                convert_options += ", include_columns=columns, column_types={column: pa.type_for_alias(dtype) for column, dtype in schema.items()}"
+            return f'''import pyarrow.csv as pacsv
 
-df = pd.read_csv("{source_config.get('file_path', '')}")
-logging.info(f"Extracted {{len(df)}} rows from CSV")
-return df'''
+# Stream the file into Parquet partitions instead of one DataFrame. pyarrow parses
+# 64 MiB blocks on multiple threads, reading only the listed columns as int64, double
+# or string, types wide enough for rows the analysis sample never saw
+{path_option}{column_options}NA_VALUES = {_CSV_NA_VALUES!r}
+stage_dir = _stage_path("extract", context, ext="")
+os.makedirs(stage_dir, exist_ok=True)
+rows = 0
+memory = 0
+reader = pacsv.open_csv(
+    path,
+    read_options=pacsv.ReadOptions(block_size=64 << 20, use_threads=True),
+    convert_options=pacsv.ConvertOptions(
+        {convert_options}
+    )
+)
+for i, batch in enumerate(reader):
+    pq.write_table(pa.Table.from_batches([batch]), os.path.join(stage_dir, f"{{i}}.parquet"), compression="zstd")
+    rows += batch.num_rows
+    memory += batch.nbytes
+logger.info("Extracted %d rows from CSV (%d bytes on disk, %d bytes in memory)", rows, os.path.getsize(path), memory)
+return stage_dir'''
         elif source_type.lower() == 'api':
             return f'''import requests
 import pandas as pd
@@ -482,27 +963,35 @@ import pandas as pd
 response = requests.get("{source_config.get('url', '')}")
 data = response.json()
 df = pd.DataFrame(data)
-logging.info(f"Extracted {{len(df)}} rows from API")
-return df'''
+logger.info("Extracted %d rows from API", len(df))
+return _stage(df, "extract", context)'''
         else:
             return '''# Add your custom extraction logic here
 df = pd.DataFrame()  # placeholder
-return df'''
+return _stage(df, "extract", context)'''
     
     def _generate_transform_code(self, transformations: List[Dict[str, Any]], analysis: Dict[str, Any]) -> str:
         """Generate transformation code based on AI analysis"""
-        transform_steps = ['# Start with the extracted data', 'df = context["task_instance"].xcom_pull(task_ids="extract_data")']
+        transform_steps = []
+        
+        subset = self._dedupe_subset(transformations)
+        deduplicated = False
         
         # Add AI-recommended transformations
         for recommendation in analysis.get('recommendations', []):
-            if 'null percentage' in recommendation.lower():
-                column_name = recommendation.split("'")[1] if "'" in recommendation else "unknown_column"
+            null_match = _NULL_RECOMMENDATION_RE.search(recommendation)
+            if null_match:
+                column_name = null_match.group(1) if null_match.group(1) is not None else "unknown_column"
                 transform_steps.append(f"# Handle nulls in {column_name}")
                 transform_steps.append(f"df['{column_name}'] = df['{column_name}'].fillna(df['{column_name}'].median())")
             
-            elif 'duplicate percentage' in recommendation.lower():
+            elif 'duplicate percentage' in recommendation.lower() and not deduplicated:
+                deduplicated = True
                 transform_steps.append("# Remove duplicates")
-                transform_steps.append("df = df.drop_duplicates()")
+                if subset:
+                    transform_steps.append(f"df.drop_duplicates(subset={subset!r}, ignore_index=True, inplace=True)")
+                else:
+                    transform_steps.append("df.drop_duplicates(ignore_index=True, inplace=True)")
         
         # Add user-defined transformations
         for transformation in transformations:
@@ -513,73 +1002,424 @@ return df'''
                 transform_steps.append(f"# Aggregate by {transformation['group_by']}")
                 transform_steps.append(f"df = df.groupby('{transformation['group_by']}').agg({transformation['aggregations']})")
         
-        if len(transform_steps) <= 2:
+        if not transform_steps:
             transform_steps.append("# No specific transformations needed based on AI analysis")
         
-        transform_steps.append('logging.info(f"Transformed data: {{len(df)}} rows")')
-        transform_steps.append('return df')
+        transform_steps.append('logger.info("Transformed data: %d rows", len(df))')
         
         return '\n'.join(transform_steps)
     
+    def _dedupe_subset(self, transformations: List[Dict[str, Any]]) -> Optional[List[str]]:
+        """Return the configured key columns to deduplicate on, or None to compare whole rows"""
+        for transformation in transformations:
+            if transformation['type'] == 'remove_duplicates' and transformation.get('subset'):
+                subset = transformation['subset']
+                return [subset] if isinstance(subset, str) else list(subset)
+        return None
+    
+    def _generate_duckdb_code(self, transformations: List[Dict[str, Any]], quality_checks: List[Dict[str, Any]], analysis: Dict[str, Any]) -> str:
+        """Generate a single DuckDB transform and validation pass over the extracted data"""
+        def quote(column: str) -> str:
+            return '"' + column.replace('"', '""') + '"'
+        
+        def aggregate(column: str, func: str) -> str:
+            if func == 'nunique':
+                return f"count(DISTINCT {quote(column)})"
+            sql_func = {'mean': 'avg', 'std': 'stddev_samp', 'var': 'var_samp'}.get(func, func)
+            return f"{sql_func}({quote(column)})"
+        
+        def execute(sql: str) -> str:
+            return f"con.execute({sql!r})"
+        
+        steps = [
+            'import duckdb',
+            '',
+            'source = context["task_instance"].xcom_pull(task_ids="extract_data")',
+            'if os.path.isdir(source):',
+            '    source = os.path.join(source, "*.parquet")',
+            'con = duckdb.connect()',
+            'con.execute("CREATE TABLE data AS SELECT * FROM read_parquet(?)", [source])'
+        ]
+        subset = self._dedupe_subset(transformations)
+        deduplicated = False
+        
+        # Add AI-recommended transformations
+        for recommendation in analysis.get('recommendations', []):
+            null_match = _NULL_RECOMMENDATION_RE.search(recommendation)
+            if null_match:
+                column_name = null_match.group(1) if null_match.group(1) is not None else "unknown_column"
+                column = quote(column_name)
+                steps.append(f"# Handle nulls in {column_name}")
+                steps.append(execute(f"CREATE OR REPLACE TABLE data AS SELECT * REPLACE (coalesce({column}, (SELECT median({column}) FROM data)) AS {column}) FROM data"))
+            
+            elif 'duplicate percentage' in recommendation.lower() and not deduplicated:
+                deduplicated = True
+                steps.append("# Remove duplicates")
+                if subset:
+                    keys = ', '.join(quote(column) for column in subset)
+                    steps.append(execute(f"CREATE OR REPLACE TABLE data AS SELECT DISTINCT ON ({keys}) * FROM data"))
+                else:
+                    steps.append(execute("CREATE OR REPLACE TABLE data AS SELECT DISTINCT * FROM data"))
+        
+        # Add user-defined transformations
+        for transformation in transformations:
+            if transformation['type'] == 'filter':
+                steps.append(f"# Filter: {transformation['condition']}")
+                steps.append(execute(f"CREATE OR REPLACE TABLE data AS SELECT * FROM data WHERE {transformation['condition']}"))
+            elif transformation['type'] == 'aggregate':
+                group_by = quote(transformation['group_by'])
+                columns = [group_by]
+                for column, funcs in transformation['aggregations'].items():
+                    if isinstance(funcs, str):
+                        columns.append(f"{aggregate(column, funcs)} AS {quote(column)}")
+                    else:
+                        columns.extend(f"{aggregate(column, func)} AS {quote(column + '_' + func)}" for func in funcs)
+                steps.append(f"# Aggregate by {transformation['group_by']}")
+                steps.append(execute(f"CREATE OR REPLACE TABLE data AS SELECT {', '.join(columns)} FROM data GROUP BY {group_by}"))
+        
+        # Collect every quality counter in one scan, paired with the statement reporting a non-zero count
+        counters = ['count(*)']
+        reports = []
+        column_types = analysis.get('column_types', {})
+        for column, col_type in column_types.items():
+            if col_type == 'email':
+                counters.append(f"count(*) FILTER (WHERE NOT coalesce(regexp_full_match({quote(column)}, '^[^@\\s]+@[^@\\s]+\\.[^@\\s]+$'), false))")
+                reports.append(f"logger.warning('Found %d invalid emails in %s', counts[{len(counters) - 1}], {column!r})")
+            elif col_type == 'identifier':
+                counters.append(f"count(*) - count(DISTINCT {quote(column)})")
+                reports.append(f"logger.warning('Non-unique identifiers found in %s', {column!r})")
+        
+        for check in quality_checks:
+            column = quote(check['column'])
+            if check['type'] == 'not_null':
+                counters.append(f"count(*) FILTER (WHERE {column} IS NULL)")
+                reports.append(f"raise ValueError('Found %d null values in %s' % (counts[{len(counters) - 1}], {check['column']!r}))")
+            elif check['type'] == 'range':
+                counters.append(f"count(*) FILTER (WHERE {column} < {check['min']} OR {column} > {check['max']})")
+                reports.append(f"raise ValueError('Found %d values out of range in %s' % (counts[{len(counters) - 1}], {check['column']!r}))")
+        
+        counter_sql = f"SELECT {', '.join(counters)} FROM data"
+        steps.append(f"counts = {execute(counter_sql)}.fetchone()")
+        steps.append('logger.info("Transformed data: %d rows", counts[0])')
+        for i, report in enumerate(reports, 1):
+            steps.append(f"if counts[{i}]:")
+            steps.append(f"    {report}")
+        steps.append("logger.info('Data validation completed successfully')")
+        steps.append('path = _stage_path("transform", context)')
+        steps.append('con.execute("COPY data TO \'" + path.replace("\'", "\'\'") + "\' (FORMAT PARQUET, COMPRESSION ZSTD)")')
+        steps.append('return path')
+        
+        return '\n'.join(steps)
+    
+    def _generate_polars_code(self, transformations: List[Dict[str, Any]], quality_checks: List[Dict[str, Any]], analysis: Dict[str, Any]) -> str:
+        """Generate a single Polars lazy query transforming and validating the extracted data"""
+        aggregations = {'nunique': 'n_unique', 'size': 'len'}
+        
+        steps = [
+            'import polars as pl',
+            '',
+            'source = context["task_instance"].xcom_pull(task_ids="extract_data")',
+            'if os.path.isdir(source):',
+            '    source = os.path.join(source, "*.parquet")',
+            'lf = pl.scan_parquet(source)'
+        ]
+        subset = self._dedupe_subset(transformations)
+        deduplicated = False
+        
+        # Add AI-recommended transformations
+        for recommendation in analysis.get('recommendations', []):
+            null_match = _NULL_RECOMMENDATION_RE.search(recommendation)
+            if null_match:
+                column_name = null_match.group(1) if null_match.group(1) is not None else "unknown_column"
+                steps.append(f"# Handle nulls in {column_name}")
+                steps.append(f"lf = lf.with_columns(pl.col({column_name!r}).fill_null(pl.col({column_name!r}).median()))")
+            
+            elif 'duplicate percentage' in recommendation.lower() and not deduplicated:
+                deduplicated = True
+                steps.append("# Remove duplicates")
+                if subset:
+                    steps.append(f"lf = lf.unique(subset={subset!r}, keep='first', maintain_order=True)")
+                else:
+                    steps.append("lf = lf.unique(maintain_order=True)")
+        
+        # Add user-defined transformations
+        for transformation in transformations:
+            if transformation['type'] == 'filter':
+                steps.append(f"# Filter: {transformation['condition']}")
+                steps.append(f"lf = lf.filter(pl.sql_expr({transformation['condition']!r}))")
+            elif transformation['type'] == 'aggregate':
+                exprs = []
+                for column, funcs in transformation['aggregations'].items():
+                    if isinstance(funcs, str):
+                        exprs.append(f"pl.col({column!r}).{aggregations.get(funcs, funcs)}()")
+                    else:
+                        exprs.extend(f"pl.col({column!r}).{aggregations.get(func, func)}().alias({column + '_' + func!r})" for func in funcs)
+                steps.append(f"# Aggregate by {transformation['group_by']}")
+                steps.append(f"lf = lf.group_by({transformation['group_by']!r}, maintain_order=True).agg({', '.join(exprs)})")
+        
+        # Collect every quality counter in one pass, paired with the statement reporting a non-zero count
+        counters = ['pl.len()']
+        reports = []
+        column_types = analysis.get('column_types', {})
+        for column, col_type in column_types.items():
+            if col_type == 'email':
+                counters.append(f"pl.col({column!r}).str.contains(r\"^[^@\\s]+@[^@\\s]+\\.[^@\\s]+$\").fill_null(False).not_().sum()")
+                reports.append(f"logger.warning('Found %d invalid emails in %s', counts[{len(counters) - 1}], {column!r})")
+            elif col_type == 'identifier':
+                counters.append(f"pl.len() - pl.col({column!r}).n_unique()")
+                reports.append(f"logger.warning('Non-unique identifiers found in %s', {column!r})")
+        
+        for check in quality_checks:
+            if check['type'] == 'not_null':
+                counters.append(f"pl.col({check['column']!r}).null_count()")
+                reports.append(f"raise ValueError('Found %d null values in %s' % (counts[{len(counters) - 1}], {check['column']!r}))")
+            elif check['type'] == 'range':
+                counters.append(f"((pl.col({check['column']!r}) < {check['min']}) | (pl.col({check['column']!r}) > {check['max']})).sum()")
+                reports.append(f"raise ValueError('Found %d values out of range in %s' % (counts[{len(counters) - 1}], {check['column']!r}))")
+        
+        steps.append('df = lf.collect()')
+        steps.append('counts = df.select(')
+        # Name the counters so Polars doesn't reject clashing default output names
+        steps.extend(f"    check_{i}={counter}," for i, counter in enumerate(counters))
+        steps.append(').row(0)')
+        steps.append('logger.info("Transformed data: %d rows", counts[0])')
+        for i, report in enumerate(reports, 1):
+            steps.append(f"if counts[{i}]:")
+            steps.append(f"    {report}")
+        steps.append("logger.info('Data validation completed successfully')")
+        steps.append('path = _stage_path("transform", context)')
+        steps.append('df.write_parquet(path, compression="zstd")')
+        steps.append('return path')
+        
+        return '\n'.join(steps)
+    
+    def _has_integer_identifier(self, analysis: Dict[str, Any]) -> bool:
+        """Whether an identifier column was sampled as integers, the only input the Numba path takes"""
+        data_quality = analysis.get('data_quality', {})
+        return any(
+            col_type == 'identifier' and pd.api.types.is_integer_dtype(data_quality.get(column, {}).get('data_type', 'object'))
+            for column, col_type in analysis.get('column_types', {}).items()
+        )
+    
+    def _generate_validation_helpers(self, analysis: Dict[str, Any], jit: bool = False) -> str:
+        """Generate module-level helpers shared by the validation code"""
+        column_types = analysis.get('column_types', {})
+        if 'identifier' not in column_types.values():
+            return ''
+        
+        if not jit:
+            return '''
+def _count_distinct(column):
+    """Count the distinct non-null values of an Arrow column"""
+    return pc.count_distinct(column).as_py()
+'''
+        
+        return '''
+_count_distinct_i64 = None
+
+def _compile_count_distinct_i64():
+    """JIT-compile the int64 distinct count, or return False when Numba isn't installed"""
+    try:
+        from numba import njit
+        from numba.core import types
+        from numba.typed import Dict
+    except ImportError:
+        return False
+
+    @njit(cache=True)
+    def count_distinct_i64(values):
+        seen = Dict.empty(types.int64, types.boolean)
+        for value in values:
+            seen[value] = True
+        return len(seen)
+
+    return count_distinct_i64
+
+def _count_distinct(column):
+    """Count the distinct non-null values of an Arrow column"""
+    global _count_distinct_i64
+    # Numba only pays off on numeric buffers; strings and nullable columns stay on Arrow's hash kernel.
+    # It is imported and compiled on first use inside a task, never when the scheduler parses the file
+    if pa.types.is_integer(column.type) and column.null_count == 0:
+        if _count_distinct_i64 is None:
+            _count_distinct_i64 = _compile_count_distinct_i64()
+        if _count_distinct_i64:
+            return _count_distinct_i64(column.to_numpy().astype("int64", copy=False))
+    return pc.count_distinct(column).as_py()
+'''
+    
     def _generate_validation_code(self, quality_checks: List[Dict[str, Any]], analysis: Dict[str, Any]) -> str:
         """Generate validation code based on AI analysis"""
-        validation_steps = ['# Start with the transformed data', 'df = context["task_instance"].xcom_pull(task_ids="transform_data")']
+        # Each check counts its violations with Arrow compute kernels over the frame's column buffers
+        checks = []
+        reports = []
         
         # Add AI-recommended validations
         column_types = analysis.get('column_types', {})
         for column, col_type in column_types.items():
             if col_type == 'email':
-                validation_steps.append(f"# Validate email format in {column}")
-                validation_steps.append(f"email_valid = df['{column}'].str.contains('@', na=False)")
-                validation_steps.append(f"if not email_valid.all():")
-                validation_steps.append(f"    logging.warning(f'Found {{(~email_valid).sum()}} invalid emails in {column}')")
+                checks.append(f"# Validate email format in {column}")
+                checks.append(f"lambda: pc.sum(pc.invert(pc.fill_null(pc.match_substring_regex(tbl.column({column!r}), r\"^[^@\\s]+@[^@\\s]+\\.[^@\\s]+$\"), False)), min_count=0).as_py(),")
+                reports.append(f"logger.warning('Found %d invalid emails in %s', counts[{len(reports)}], {column!r})")
             elif col_type == 'identifier':
-                validation_steps.append(f"# Check for unique identifiers in {column}")
-                validation_steps.append(f"if df['{column}'].nunique() != len(df):")
-                validation_steps.append(f"    logging.warning(f'Non-unique identifiers found in {column}')")
+                checks.append(f"# Check for unique identifiers in {column}")
+                checks.append(f"lambda: tbl.num_rows - _count_distinct(tbl.column({column!r})),")
+                reports.append(f"logger.warning('Non-unique identifiers found in %s', {column!r})")
         
         # Add user-defined quality checks
         for check in quality_checks:
             if check['type'] == 'not_null':
-                validation_steps.append(f"# Check for nulls in {check['column']}")
-                validation_steps.append(f"null_count = df['{check['column']}'].isnull().sum()")
-                validation_steps.append(f"if null_count > 0:")
-                validation_steps.append(f"    raise ValueError(f'Found {{null_count}} null values in {check['column']}')")
+                checks.append(f"# Check for nulls in {check['column']}")
+                checks.append(f"lambda: tbl.column({check['column']!r}).null_count,")
+                reports.append(f"raise ValueError('Found %d null values in %s' % (counts[{len(reports)}], {check['column']!r}))")
             elif check['type'] == 'range':
-                validation_steps.append(f"# Validate range for {check['column']}")
-                validation_steps.append(f"out_of_range = df[(df['{check['column']}'] < {check['min']}) | (df['{check['column']}'] > {check['max']})].shape[0]")
-                validation_steps.append(f"if out_of_range > 0:")
-                validation_steps.append(f"    raise ValueError(f'Found {{out_of_range}} values out of range in {check['column']}')")
-        
-        if len(validation_steps) <= 2:
+                checks.append(f"# Validate range for {check['column']}")
+                checks.append(f"lambda: pc.sum(pc.or_(pc.less(tbl.column({check['column']!r}), {check['min']}), pc.greater(tbl.column({check['column']!r}), {check['max']})), min_count=0).as_py(),")
+                reports.append(f"raise ValueError('Found %d values out of range in %s' % (counts[{len(reports)}], {check['column']!r}))")
+        
+        validation_steps = ['tbl = pa.Table.from_pandas(df, preserve_index=False)']
+        if reports:
+            # The checks scan independent columns, so they run concurrently; Arrow kernels release the GIL
+            validation_steps.append('checks = [')
+            validation_steps.extend(f"    {line}" for line in checks)
+            validation_steps.append(']')
+            validation_steps.append('with ThreadPoolExecutor(max_workers=min(len(checks), os.cpu_count() or 1, 4)) as executor:')
+            validation_steps.append('    counts = list(executor.map(lambda check: check(), checks))')
+            for i, report in enumerate(reports):
+                validation_steps.append(f"if counts[{i}]:")
+                validation_steps.append(f"    {report}")
+        else:
             validation_steps.append("# No specific validations configured")
         
-        validation_steps.append("logging.info('Data validation completed successfully')")
-        validation_steps.append('return df')
+        validation_steps.append("logger.info('Data validation completed successfully')")
         
         return '\n'.join(validation_steps)
     
-    def _generate_load_code(self, dest_type: str, dest_config: Dict[str, Any]) -> str:
+    def _generate_load_helpers(self, dest_type: str, dest_config: Dict[str, Any], framework: str) -> str:
+        """Generate module-level helpers shared by the load code"""
+        if dest_type.lower() != 'postgresql':
+            return ''
+        
+        engine_options = 'pool_pre_ping=True, pool_size=4'
+        if dest_config.get("load_method", "copy") == "insert":
+            # Fallback for targets that don't accept COPY FROM STDIN (e.g. Redshift)
+            engine_options += ", executemany_mode='values_plus_batch', executemany_values_page_size=10_000, executemany_batch_page_size=500"
+        
+        if framework.lower() == 'airflow':
+            # Credentials live in an Airflow connection rather than in the generated code
+            url_code = f"""from airflow.hooks.base import BaseHook
+
+    uri = BaseHook.get_connection('{dest_config.get("conn_id", "postgres_default")}').get_uri()
+    uri = uri.replace('postgres://', 'postgresql://', 1)
+"""
+        else:
+            url_code = f"""
+    uri = 'postgresql://{dest_config.get("user", "")}:{dest_config.get("password", "")}@{dest_config.get("host", "localhost")}/{dest_config.get("database", "")}'
+"""
+        
+        return f'''
+@lru_cache(maxsize=1)
+def _engine():
+    """Create the destination engine once per worker process so its pool survives retries"""
+    from sqlalchemy import create_engine
+    {url_code}
+    return create_engine(uri, {engine_options})
+'''
+    
+    def _generate_load_code(self, dest_type: str, dest_config: Dict[str, Any], partitioned: bool = False, framework: str = 'airflow') -> str:
         """Generate load code based on destination type"""
+        # Only Airflow pulls the staged path from XCom; mapped Airflow tasks and Prefect receive it as an argument
+        if framework.lower() == 'airflow' and not partitioned:
+            source = 'context["task_instance"].xcom_pull(task_ids="transform_and_validate")'
+        else:
+            source = 'path'
         if dest_type.lower() == 'postgresql':
-            return f'''from sqlalchemy import create_engine
+            table = dest_config.get("table", "processed_data")
+            # Each mapped partition replaces its own stage table for this run, so retries and reruns
+            # don't duplicate rows; the swap_table task then replaces the target once
+            stage_code = f'''
+run = hashlib.blake2b(context["run_id"].encode(), digest_size=4).hexdigest()
+stage = f"{table}_stage_{{run}}_{{context['task_instance'].map_index}}"''' if partitioned else ''
+            if dest_config.get("load_method", "copy") == "insert":
+                target = 'stage' if partitioned else repr(table)
+                imports = 'import hashlib\n\n' if partitioned else ''
+                result = '\nreturn stage' if partitioned else ''
+                return f'''{imports}df = _load({source})
+engine = _engine(){stage_code}
+
+# Fold the rows into multi-VALUES INSERTs inside a single transaction
+with engine.begin() as conn:
+    df.to_sql({target}, conn, if_exists='replace', index=False, chunksize=10_000)
+logger.info("Loaded %d rows to PostgreSQL", len(df)){result}'''
+            if partitioned:
+                return f'''import hashlib
+import io
+
+df = _load(path)
+engine = _engine(){stage_code}
 
-df = context["task_instance"].xcom_pull(task_ids="validate_data")
-engine = create_engine('postgresql://{dest_config.get("user", "")}:{dest_config.get("password", "")}@{dest_config.get("host", "localhost")}/{dest_config.get("database", "")}')
-df.to_sql('{dest_config.get("table", "processed_data")}', engine, if_exists='replace', index=False)
-logging.info(f"Loaded {{len(df)}} rows to PostgreSQL")'''
+# Bulk load the partition's stage table with COPY
+df.head(0).to_sql(stage, engine, if_exists='replace', index=False)
+buf = io.StringIO()
+df.to_csv(buf, index=False, header=False, sep='\\t', na_rep='\\\\N')
+buf.seek(0)
+conn = engine.raw_connection()
+try:
+    with conn.cursor() as cursor:
+        cursor.copy_expert(f"COPY {{stage}} FROM STDIN WITH (FORMAT CSV, DELIMITER E'\\\\t', NULL '\\\\N')", buf)
+    conn.commit()
+finally:
+    conn.close()
+logger.info("Loaded %d rows to PostgreSQL", len(df))
+return stage'''
+            return f'''import io
+from sqlalchemy import inspect
+
+df = _load({source})
+engine = _engine()
+
+# Bulk load a fresh stage table with COPY, then swap it in within the same
+# transaction so readers never wait on a drop-and-recreate of the target.
+# The stage copies an existing target's constraints, indexes and defaults so the swap keeps them
+with engine.begin() as conn:
+    conn.exec_driver_sql("DROP TABLE IF EXISTS {table}_stage")
+    if inspect(conn).has_table('{table}'):
+        conn.exec_driver_sql("CREATE TABLE {table}_stage (LIKE {table} INCLUDING ALL)")
+    else:
+        df.head(0).to_sql('{table}_stage', conn, index=False)
+columns = ', '.join('"' + str(column).replace('"', '""') + '"' for column in df.columns)
+buf = io.StringIO()
+df.to_csv(buf, index=False, header=False, sep='\\t', na_rep='\\\\N')
+buf.seek(0)
+conn = engine.raw_connection()
+try:
+    with conn.cursor() as cursor:
+        cursor.copy_expert(f"COPY {table}_stage ({{columns}}) FROM STDIN WITH (FORMAT CSV, DELIMITER E'\\\\t', NULL '\\\\N')", buf)
+        cursor.execute("DROP TABLE IF EXISTS {table}_old")
+        cursor.execute("ALTER TABLE IF EXISTS {table} RENAME TO {table}_old")
+        cursor.execute("ALTER TABLE {table}_stage RENAME TO {table}")
+    conn.commit()
+finally:
+    conn.close()
+logger.info("Loaded %d rows to PostgreSQL", len(df))'''
         elif dest_type.lower() == 'csv':
-            return f'''df = context["task_instance"].xcom_pull(task_ids="validate_data")
-df.to_csv('{dest_config.get("file_path", "output.csv")}', index=False)
-logging.info(f"Loaded {{len(df)}} rows to CSV")'''
+            file_path = dest_config.get("file_path", "output.csv")
+            target = repr(file_path)
+            if partitioned:
+                # Each partition writes its own file next to the configured output
+                output = Path(file_path)
+                target = "f'" + str(output.with_suffix('')) + '_{context["task_instance"].map_index}' + output.suffix + "'"
+            return f'''df = _load({source})
+df.to_csv({target}, index=False)
+logger.info("Loaded %d rows to CSV", len(df))'''
         else:
-            return '''# Add your custom load logic here
-df = context["task_instance"].xcom_pull(task_ids="validate_data")
-logging.info(f"Custom load logic for {{len(df)}} rows")'''
+            return f'''# Add your custom load logic here
+df = _load({source})
+logger.info("Custom load logic for %d rows", len(df))'''
     
     def _generate_dbt_model(self, config: PipelineConfig, analysis: Dict[str, Any]) -> str:
         """Generate dbt model SQL"""
-        return self.templates['dbt_model'].format(
+        return self.templates['dbt_model'].substitute(
             pipeline_name=config.name.replace(' ', '_').lower(),
             timestamp=datetime.now().isoformat(),
             source_schema=config.source_config.get('schema', 'public'),
@@ -589,11 +1429,14 @@ logging.info(f"Custom load logic for {{len(df)}} rows")'''
             transformations="-- AI-recommended transformations would go here"
         )
     
-    def _generate_requirements(self, framework: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _generate_requirements(framework: str, engine: str = 'pandas', jit: bool = False) -> str:
         """Generate requirements.txt based on framework"""
         base_requirements = [
-            "pandas>=1.3.0",
+            "pandas>=2.0.0",
             "numpy>=1.21.0",
+            "pyarrow>=10.0.0",
             "scikit-learn>=1.0.0",
             "pyyaml>=6.0",
             "requests>=2.28.0"
@@ -614,13 +1457,21 @@ logging.info(f"Custom load logic for {{len(df)}} rows")'''
                 "dbt-postgres>=1.0.0"
             ])
         
+        if engine.lower() == 'duckdb':
+            base_requirements.append("duckdb>=0.10.0")
+        elif engine.lower() == 'polars':
+            base_requirements.append("polars>=1.0.0")
+        
+        if jit:
+            base_requirements.append("numba>=0.57.0")
+        
         return '\n'.join(base_requirements)
 
 class DataQualityValidator:
     """AI-powered data quality validation"""
     
     def __init__(self):
-        self.anomaly_detector = IsolationForest(contamination=0.1, random_state=42)
+        self.anomaly_detector = IsolationForest(contamination=0.1, random_state=42, n_jobs=-1)
         
     def validate_data_quality(self, df: pd.DataFrame, quality_rules: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Validate data quality using AI and predefined rules"""
@@ -639,7 +1490,9 @@ class DataQualityValidator:
                 validation_results['issues'].append(result)
         
         # AI-powered quality assessment
-        ai_insights = self._ai_quality_assessment(df)
+        # Classify the columns once and share the result between the passes
+        object_columns = self._object_columns(df)
+        ai_insights = self._ai_quality_assessment(df, NumericView.from_frame(df), object_columns)
         validation_results['ai_insights'] = ai_insights
         
         # Overall metrics
@@ -647,49 +1500,138 @@ class DataQualityValidator:
             'total_rows': len(df),
             'total_columns': len(df.columns),
             'completeness_score': self._calculate_completeness_score(df),
-            'consistency_score': self._calculate_consistency_score(df),
+            'consistency_score': self._calculate_consistency_score(df, object_columns),
             'accuracy_score': ai_insights.get('accuracy_score', 0.95)
         }
         
         return validation_results
     
-    def _execute_quality_rule(self, df: pd.DataFrame, rule: Dict[str, Any]) -> Dict[str, Any]:
-        """Execute a single quality rule"""
-        try:
-            if rule['type'] == 'not_null':
-                null_count = df[rule['column']].isnull().sum()
-                passed = null_count == 0
-                return {
-                    'rule': rule,
-                    'passed': passed,
-                    'message': f"Found {null_count} null values in {rule['column']}" if not passed else "No null values found"
-                }
+    def validate_data_quality_chunks(self, chunks: Iterable[pd.DataFrame], quality_rules: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Validate data streamed in chunks, keeping only running counts and a bounded sample in memory"""
+        validation_results = {
+            'passed': True,
+            'issues': [],
+            'metrics': {},
+            'ai_insights': {}
+        }
+        
+        rule_states = [{'count': 0, 'seen': set(), 'nulls': 0, 'rows': 0, 'error': None} for _ in quality_rules]
+        pattern_state = {'lengths': {}, 'stripped_lengths': {}}
+        freshness_state = {}
+        total_rows = total_columns = missing_cells = 0
+        sample_chunks = []
+        sample_rows = 0
+        
+        for chunk in chunks:
+            total_rows += len(chunk)
+            total_columns = len(chunk.columns)
+            missing_cells += np.count_nonzero(chunk.isna().to_numpy())
             
-            elif rule['type'] == 'unique':
-                duplicate_count = df[rule['column']].duplicated().sum()
-                passed = duplicate_count == 0
-                return {
-                    'rule': rule,
-                    'passed': passed,
-                    'message': f"Found {duplicate_count} duplicate values in {rule['column']}" if not passed else "All values are unique"
-                }
+            for rule, state in zip(quality_rules, rule_states):
+                self._update_quality_rule_state(chunk, rule, state)
             
-            elif rule['type'] == 'range':
-                out_of_range = df[(df[rule['column']] < rule['min']) | (df[rule['column']] > rule['max'])].shape[0]
-                passed = out_of_range == 0
-                return {
-                    'rule': rule,
-                    'passed': passed,
-                    'message': f"Found {out_of_range} values out of range [{rule['min']}, {rule['max']}] in {rule['column']}" if not passed else "All values in range"
-                }
+            self._update_pattern_state(chunk, pattern_state)
+            self._update_freshness_state(chunk, freshness_state)
             
-            else:
-                return {
+            # Only anomaly detection needs the rows themselves, and it runs on the leading ones
+            if sample_rows < VALIDATION_ANOMALY_SAMPLE_ROWS:
+                sample_chunks.append(chunk.iloc[:VALIDATION_ANOMALY_SAMPLE_ROWS - sample_rows])
+                sample_rows += len(sample_chunks[-1])
+        
+        # Run predefined quality checks on the accumulated counts
+        for rule, state in zip(quality_rules, rule_states):
+            if state['error'] is not None:
+                result = {
                     'rule': rule,
                     'passed': False,
-                    'message': f"Unknown rule type: {rule['type']}"
+                    'message': f"Error executing rule: {state['error']}"
                 }
-                
+            elif rule['type'] == 'unique':
+                # Every value after the first occurrence is a duplicate; nulls count as one value
+                non_null_rows = state['rows'] - state['nulls']
+                result = self._quality_rule_result(rule, non_null_rows - len(state['seen']) + max(state['nulls'] - 1, 0))
+            else:
+                result = self._quality_rule_result(rule, state['count'])
+            
+            if not result['passed']:
+                validation_results['passed'] = False
+                validation_results['issues'].append(result)
+        
+        sample = pd.concat(sample_chunks, ignore_index=True) if sample_chunks else pd.DataFrame()
+        
+        # AI-powered quality assessment, with the pattern and freshness results covering every row
+        ai_insights = self._ai_quality_assessment(
+            sample,
+            pattern_consistency=self._pattern_consistency(pattern_state),
+            data_freshness=self._data_freshness(freshness_state)
+        )
+        validation_results['ai_insights'] = ai_insights
+        
+        # Overall metrics
+        total_cells = total_rows * total_columns
+        validation_results['metrics'] = {
+            'total_rows': total_rows,
+            'total_columns': total_columns,
+            'completeness_score': float((total_cells - missing_cells) / total_cells) if total_cells else 1.0,
+            'consistency_score': self._consistency_score(total_columns, pattern_state) if total_rows else 1.0,
+            'accuracy_score': ai_insights.get('accuracy_score', 0.95)
+        }
+        
+        return validation_results
+    
+    def _update_quality_rule_state(self, chunk: pd.DataFrame, rule: Dict[str, Any], state: Dict[str, Any]):
+        """Fold one chunk into the running violation count of a quality rule"""
+        if state['error'] is not None:
+            return
+        
+        try:
+            if rule['type'] == 'unique':
+                values = chunk[rule['column']]
+                state['rows'] += len(values)
+                state['nulls'] += int(values.isnull().sum())
+                state['seen'].update(values.dropna().unique().tolist())
+            elif rule['type'] in ('not_null', 'range'):
+                state['count'] += int(self._count_rule_violations(chunk, rule))
+        except Exception as e:
+            state['error'] = str(e)
+    
+    def _count_rule_violations(self, df: pd.DataFrame, rule: Dict[str, Any]) -> int:
+        """Count the rows of a frame that violate a not_null, unique or range rule"""
+        if rule['type'] == 'not_null':
+            return df[rule['column']].isnull().sum()
+        if rule['type'] == 'unique':
+            return df[rule['column']].duplicated().sum()
+        return df[(df[rule['column']] < rule['min']) | (df[rule['column']] > rule['max'])].shape[0]
+    
+    def _quality_rule_result(self, rule: Dict[str, Any], violations: int) -> Dict[str, Any]:
+        """Describe the outcome of a quality rule given its violation count"""
+        passed = violations == 0
+        
+        if rule['type'] == 'not_null':
+            message = f"Found {violations} null values in {rule['column']}" if not passed else "No null values found"
+        elif rule['type'] == 'unique':
+            message = f"Found {violations} duplicate values in {rule['column']}" if not passed else "All values are unique"
+        elif rule['type'] == 'range':
+            message = f"Found {violations} values out of range [{rule['min']}, {rule['max']}] in {rule['column']}" if not passed else "All values in range"
+        else:
+            return {
+                'rule': rule,
+                'passed': False,
+                'message': f"Unknown rule type: {rule['type']}"
+            }
+        
+        return {
+            'rule': rule,
+            'passed': passed,
+            'message': message
+        }
+    
+    def _execute_quality_rule(self, df: pd.DataFrame, rule: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute a single quality rule"""
+        try:
+            if rule['type'] not in ('not_null', 'unique', 'range'):
+                return self._quality_rule_result(rule, 0)
+            return self._quality_rule_result(rule, self._count_rule_violations(df, rule))
         except Exception as e:
             return {
                 'rule': rule,
@@ -697,32 +1639,38 @@ class DataQualityValidator:
                 'message': f"Error executing rule: {str(e)}"
             }
     
-    def _ai_quality_assessment(self, df: pd.DataFrame) -> Dict[str, Any]:
-        """AI-powered quality assessment"""
+    def _ai_quality_assessment(self, df: pd.DataFrame, numeric: Optional[NumericView] = None,
+                               object_columns: Optional[pd.Index] = None,
+                               pattern_consistency: Optional[Dict[str, Any]] = None,
+                               data_freshness: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """AI-powered quality assessment, reusing pattern and freshness results accumulated elsewhere"""
         insights = {}
+        numeric = numeric or NumericView.from_frame(df)
         
         # Detect anomalies in numeric columns
-        numeric_columns = df.select_dtypes(include=[np.number]).columns
-        if len(numeric_columns) > 0:
-            numeric_data = df[numeric_columns].fillna(0)
+        if len(numeric.frame.columns) > 0:
+            numeric_data = numeric.arr
             
             if len(numeric_data) > 10:
                 try:
-                    outliers = self.anomaly_detector.fit_predict(numeric_data)
-                    anomaly_percentage = (outliers == -1).sum() / len(df) * 100
+                    outliers = _detect_outliers(self.anomaly_detector, numeric_data)
+                    anomaly_count = int((outliers == -1).sum())
+                    anomaly_percentage = anomaly_count / len(df) * 100
                     insights['anomaly_detection'] = {
                         'anomaly_percentage': float(anomaly_percentage),
-                        'anomaly_count': int((outliers == -1).sum()),
+                        'anomaly_count': anomaly_count,
                         'status': 'high' if anomaly_percentage > 5 else 'normal'
                     }
                 except:
                     insights['anomaly_detection'] = {'error': 'Could not perform anomaly detection'}
         
         # Pattern consistency analysis
-        insights['pattern_consistency'] = self._analyze_pattern_consistency(df)
+        if pattern_consistency is None:
+            pattern_consistency = self._analyze_pattern_consistency(df, object_columns)
+        insights['pattern_consistency'] = pattern_consistency
         
         # Data freshness analysis
-        insights['data_freshness'] = self._analyze_data_freshness(df)
+        insights['data_freshness'] = self._analyze_data_freshness(df) if data_freshness is None else data_freshness
         
         # Calculate overall accuracy score based on various factors
         accuracy_factors = []
@@ -737,76 +1685,129 @@ class DataQualityValidator:
             
         return insights
     
-    def _analyze_pattern_consistency(self, df: pd.DataFrame) -> Dict[str, Any]:
+    @staticmethod
+    def _object_columns(df: pd.DataFrame) -> pd.Index:
+        """Columns of object dtype, the ones the string consistency checks inspect"""
+        # Checked on the NumPy dtype kind: select_dtypes would also pick pandas 3 'str' columns,
+        # whose extension dtypes report kind 'O' too
+        return df.columns[[isinstance(dtype, np.dtype) and dtype.kind == 'O' for dtype in df.dtypes]]
+    
+    def _analyze_pattern_consistency(self, df: pd.DataFrame, object_columns: Optional[pd.Index] = None) -> Dict[str, Any]:
         """Analyze pattern consistency across columns"""
+        state = {'lengths': {}, 'stripped_lengths': {}}
+        self._update_pattern_state(df, state, object_columns)
+        return self._pattern_consistency(state)
+    
+    def _update_pattern_state(self, df: pd.DataFrame, state: Dict[str, Any], object_columns: Optional[pd.Index] = None):
+        """Fold a frame's string lengths into the running per-column length counts"""
+        if df.empty:
+            return
+        
+        object_columns = self._object_columns(df) if object_columns is None else object_columns
+        for column in object_columns:
+            values = df[column].dropna().astype(str)
+            state['lengths'].setdefault(column, Counter()).update(values.str.len().value_counts().to_dict())
+            state['stripped_lengths'].setdefault(column, set()).update(values.str.strip().str.len().unique().tolist())
+    
+    def _pattern_consistency(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        """Score each string column by the share of its values having the most common length"""
         consistency_results = {}
-        
-        for column in df.columns:
-            if df[column].dtype == 'object':
-                # Check string pattern consistency
-                patterns = df[column].dropna().astype(str).apply(lambda x: len(x)).value_counts()
-                if len(patterns) > 1:
-                    consistency_score = patterns.max() / patterns.sum()
-                    consistency_results[column] = {
-                        'type': 'string_length_pattern',
-                        'consistency_score': float(consistency_score),
-                        'status': 'inconsistent' if consistency_score < 0.8 else 'consistent'
-                    }
+        for column, lengths in state['lengths'].items():
+            if len(lengths) > 1:
+                consistency_score = max(lengths.values()) / sum(lengths.values())
+                consistency_results[column] = {
+                    'type': 'string_length_pattern',
+                    'consistency_score': float(consistency_score),
+                    'status': 'inconsistent' if consistency_score < 0.8 else 'consistent'
+                }
         
         return consistency_results
     
     def _analyze_data_freshness(self, df: pd.DataFrame) -> Dict[str, Any]:
         """Analyze data freshness based on date columns"""
+        state = {}
+        self._update_freshness_state(df, state)
+        return self._data_freshness(state)
+    
+    def _update_freshness_state(self, df: pd.DataFrame, state: Dict[str, Any]):
+        """Fold a frame's date columns into their running latest date and parsed-value counts"""
+        if df.empty:
+            return
+        
+        # Parse each candidate date column once; columns already of datetime dtype need no parsing.
+        # Unparseable values become NaT rather than raising, and repeated strings are parsed once
+        date_columns = df.columns[df.columns.astype(str).str.contains('date|time', case=False, regex=True)]
+        for column in date_columns:
+            column_state = state.setdefault(column, {'latest': None, 'parsed': 0, 'values': 0, 'error': False})
+            if column_state['error']:
+                continue
+            try:
+                values = df[column]
+                if pd.api.types.is_datetime64_any_dtype(values):
+                    dates = values.dropna()
+                else:
+                    dates = pd.to_datetime(values, errors='coerce', cache=True).dropna()
+                column_state['parsed'] += len(dates)
+                column_state['values'] += int(values.count())
+                if len(dates) > 0:
+                    latest_date = dates.max()
+                    if column_state['latest'] is None or latest_date > column_state['latest']:
+                        column_state['latest'] = latest_date
+            except:
+                column_state['error'] = True
+    
+    def _data_freshness(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        """Report how old the latest date of each date column is"""
         freshness_results = {}
-        
-        # Try to identify date columns
-        date_columns = []
-        for column in df.columns:
-            if 'date' in column.lower() or 'time' in column.lower():
-                try:
-                    pd.to_datetime(df[column].head(100))
-                    date_columns.append(column)
-                except:
-                    continue
-        
-        if date_columns:
-            for column in date_columns:
-                try:
-                    dates = pd.to_datetime(df[column].dropna())
-                    if len(dates) > 0:
-                        latest_date = dates.max()
-                        days_old = (datetime.now() - latest_date).days
-                        freshness_results[column] = {
-                            'latest_date': latest_date.isoformat(),
-                            'days_old': int(days_old),
-                            'status': 'fresh' if days_old <= 7 else 'stale'
-                        }
-                except:
-                    continue
+        # One reference time, so every column's age is measured against the same instant
+        now = datetime.now()
+        for column, column_state in state.items():
+            # Treat the column as dates only when nearly all of its values parse
+            if column_state['error'] or column_state['latest'] is None or column_state['parsed'] <= 0.9 * column_state['values']:
+                continue
+            try:
+                latest_date = column_state['latest']
+                days_old = (now - latest_date).days
+                freshness_results[column] = {
+                    'latest_date': latest_date.isoformat(),
+                    'days_old': int(days_old),
+                    'status': 'fresh' if days_old <= 7 else 'stale'
+                }
+            except:
+                continue
         
         return freshness_results
     
     def _calculate_completeness_score(self, df: pd.DataFrame) -> float:
         """Calculate overall data completeness score"""
-        total_cells = df.shape[0] * df.shape[1]
-        missing_cells = df.isnull().sum().sum()
+        n_rows, n_cols = df.shape
+        total_cells = n_rows * n_cols
+        if total_cells == 0:
+            # Nothing is missing from an empty frame
+            return 1.0
+        
+        # One count over the boolean block; df.to_numpy() would copy mixed dtypes into an object array
+        missing_cells = np.count_nonzero(df.isna().to_numpy())
         return float((total_cells - missing_cells) / total_cells)
     
-    def _calculate_consistency_score(self, df: pd.DataFrame) -> float:
+    def _calculate_consistency_score(self, df: pd.DataFrame, object_columns: Optional[pd.Index] = None) -> float:
         """Calculate overall data consistency score"""
-        consistency_scores = []
+        if df.empty:
+            # Every column of an empty frame scores as consistent
+            return 1.0
         
-        for column in df.columns:
-            if df[column].dtype == 'object':
-                # Check for consistent formatting
-                unique_patterns = df[column].dropna().astype(str).apply(lambda x: len(x.strip())).nunique()
-                if unique_patterns <= 3:  # Arbitrary threshold for "consistent"
-                    consistency_scores.append(1.0)
-                else:
-                    consistency_scores.append(0.7)
-            else:
-                # Numeric columns are generally consistent
-                consistency_scores.append(1.0)
+        state = {'lengths': {}, 'stripped_lengths': {}}
+        self._update_pattern_state(df, state, object_columns)
+        return self._consistency_score(df.shape[1], state)
+    
+    def _consistency_score(self, n_columns: int, state: Dict[str, Any]) -> float:
+        """Average the per-column consistency scores given the accumulated string lengths"""
+        # Numeric columns are generally consistent
+        consistency_scores = [1.0] * (n_columns - len(state['stripped_lengths']))
+        
+        for stripped_lengths in state['stripped_lengths'].values():
+            # Check for consistent formatting
+            consistency_scores.append(1.0 if len(stripped_lengths) <= 3 else 0.7)  # Arbitrary threshold for "consistent"
         
         return sum(consistency_scores) / len(consistency_scores) if consistency_scores else 1.0
 
@@ -819,6 +1820,8 @@ class DataOpsManager:
         self.validator = DataQualityValidator()
         self.pipelines: Dict[str, PipelineConfig] = {}
         self.config_path = config_path or "dataops_config.json"
+        # One file per pipeline, so a change only rewrites the pipeline it touches
+        self.config_dir = Path(self.config_path).with_suffix('')
         
         # Load existing configurations
         self._load_configurations()
@@ -827,7 +1830,8 @@ class DataOpsManager:
                                  data_source: str, 
                                  pipeline_name: str,
                                  framework: str = "airflow",
-                                 destination_config: Dict[str, Any] = None) -> Dict[str, Any]:
+                                 destination_config: Dict[str, Any] = None,
+                                 engine: str = "pandas") -> Dict[str, Any]:
         """Create a complete pipeline from data source using AI analysis"""
         
         logger.info(f"Creating AI-powered pipeline: {pipeline_name}")
@@ -835,7 +1839,7 @@ class DataOpsManager:
         # Step 1: Load and analyze data
         try:
             if data_source.endswith('.csv'):
-                df = pd.read_csv(data_source)
+                df = pd.read_csv(data_source, nrows=ANALYSIS_SAMPLE_ROWS)
             elif data_source.endswith('.json'):
                 df = pd.read_json(data_source)
             else:
@@ -857,7 +1861,8 @@ class DataOpsManager:
             data_source, 
             analysis_results, 
             framework,
-            destination_config or {"type": "csv", "file_path": "output.csv"}
+            destination_config or {"type": "csv", "file_path": "output.csv"},
+            engine
         )
         
         # Step 4: Generate pipeline code
@@ -866,13 +1871,14 @@ class DataOpsManager:
         
         # Step 5: Save pipeline configuration
         self.pipelines[pipeline_name] = pipeline_config
-        self._save_configurations()
+        self._save_configuration(pipeline_name)
         
         return {
             "success": True,
             "pipeline_name": pipeline_name,
             "analysis": analysis_results,
-            "config": asdict(pipeline_config),
+            # Decoded from the JSON encoded once when the config was saved, without an asdict walk
+            "config": pipeline_config.to_dict(),
             "generated_code": generated_code,
             "recommendations": analysis_results.get('recommendations', [])
         }
@@ -882,7 +1888,8 @@ class DataOpsManager:
                                data_source: str, 
                                analysis: Dict[str, Any],
                                framework: str,
-                               destination_config: Dict[str, Any]) -> PipelineConfig:
+                               destination_config: Dict[str, Any],
+                               engine: str = "pandas") -> PipelineConfig:
         """Create pipeline configuration based on AI analysis"""
         
         # Determine source configuration
@@ -899,14 +1906,15 @@ class DataOpsManager:
         # Generate transformations based on AI recommendations
         transformations = []
         for recommendation in analysis.get('recommendations', []):
-            if 'null percentage' in recommendation.lower():
-                column_name = recommendation.split("'")[1] if "'" in recommendation else "unknown_column"
+            null_match = _NULL_RECOMMENDATION_RE.search(recommendation)
+            if null_match:
+                column_name = null_match.group(1) if null_match.group(1) is not None else "unknown_column"
                 transformations.append({
                     "type": "fill_nulls",
                     "column": column_name,
                     "method": "median"
                 })
-            elif 'duplicate' in recommendation.lower():
+            elif _DUPLICATE_RECOMMENDATION_RE.search(recommendation):
                 transformations.append({
                     "type": "remove_duplicates",
                     "subset": None
@@ -949,7 +1957,8 @@ class DataOpsManager:
             destination_config=destination_config,
             schedule=schedule,
             quality_checks=quality_checks,
-            framework=framework
+            framework=framework,
+            engine=engine
         )
     
     def validate_pipeline_data(self, pipeline_name: str, data_path: str) -> Dict[str, Any]:
@@ -959,14 +1968,16 @@ class DataOpsManager:
             return {"error": f"Pipeline '{pipeline_name}' not found"}
         
         try:
-            # Load data
-            df = pd.read_csv(data_path) if data_path.endswith('.csv') else pd.read_json(data_path)
-            
             # Get pipeline configuration
             pipeline_config = self.pipelines[pipeline_name]
             
-            # Perform validation
-            validation_results = self.validator.validate_data_quality(df, pipeline_config.quality_checks)
+            # Perform validation, streaming CSV files in chunks rather than loading them whole
+            if data_path.endswith('.csv'):
+                chunks = pd.read_csv(data_path, chunksize=VALIDATION_CHUNK_ROWS)
+                validation_results = self.validator.validate_data_quality_chunks(chunks, pipeline_config.quality_checks)
+            else:
+                df = pd.read_json(data_path)
+                validation_results = self.validator.validate_data_quality(df, pipeline_config.quality_checks)
             
             return validation_results
             
@@ -1005,21 +2016,22 @@ class DataOpsManager:
         try:
             config = self.pipelines[pipeline_name]
             
-            # Update allowed fields
+            # Update allowed fields, reassigning private copies so the caller's later edits
+            # can't bypass the config's cache invalidation
             if 'schedule' in updates:
                 config.schedule = updates['schedule']
             if 'transformations' in updates:
-                config.transformations = updates['transformations']
+                config.transformations = copy.deepcopy(updates['transformations'])
             if 'quality_checks' in updates:
-                config.quality_checks = updates['quality_checks']
+                config.quality_checks = copy.deepcopy(updates['quality_checks'])
             
             # Save updated configuration
-            self._save_configurations()
+            self._save_configuration(pipeline_name)
             
             return {
                 "success": True,
                 "message": f"Pipeline '{pipeline_name}' updated successfully",
-                "config": asdict(config)
+                "config": config.to_dict()
             }
             
         except Exception as e:
@@ -1032,7 +2044,7 @@ class DataOpsManager:
             return {"error": f"Pipeline '{pipeline_name}' not found"}
         
         del self.pipelines[pipeline_name]
-        self._save_configurations()
+        self._delete_configuration(pipeline_name)
         
         return {
             "success": True,
@@ -1047,7 +2059,7 @@ class DataOpsManager:
         
         config = self.pipelines[pipeline_name]
         
-        doc = f"""# {config.name} Pipeline Documentation
+        parts = [f"""# {config.name} Pipeline Documentation
 
 ## Overview
 - **Framework**: {config.framework}
@@ -1056,69 +2068,98 @@ class DataOpsManager:
 
 ## Data Source
 - **Type**: {config.source_type}
-- **Configuration**: {json.dumps(config.source_config, indent=2)}
+- **Configuration**: {config.source_config_json}
 
 ## Data Destination
 - **Type**: {config.destination_type}
-- **Configuration**: {json.dumps(config.destination_config, indent=2)}
+- **Configuration**: {config.destination_config_json}
 
-## Transformations ({len(config.transformations)})
-"""
-        
-        for i, transform in enumerate(config.transformations, 1):
-            doc += f"### {i}. {transform.get('type', 'Unknown').title()}\n"
-            for key, value in transform.items():
-                if key != 'type':
-                    doc += f"- **{key.title()}**: {value}\n"
-            doc += "\n"
+"""]
         
-        doc += f"""## Quality Checks ({len(config.quality_checks)})
-"""
-        
-        for i, check in enumerate(config.quality_checks, 1):
-            doc += f"### {i}. {check.get('type', 'Unknown').title()}\n"
-            for key, value in check.items():
-                if key != 'type':
-                    doc += f"- **{key.title()}**: {value}\n"
-            doc += "\n"
+        # Collect fragments and join once instead of growing one string
+        for title, steps in (('Transformations', config.transformations), ('Quality Checks', config.quality_checks)):
+            parts.append(f"## {title} ({len(steps)})\n")
+            for i, step in enumerate(steps, 1):
+                parts.append(f"### {i}. {step.get('type', 'Unknown').title()}\n")
+                parts.extend(f"- **{key.title()}**: {value}\n" for key, value in step.items() if key != 'type')
+                parts.append("\n")
         
-        return doc
+        return ''.join(parts)
     
     def _load_configurations(self):
-        """Load pipeline configurations from file"""
+        """Load pipeline configurations from the per-pipeline files, migrating a legacy combined file"""
         try:
-            if Path(self.config_path).exists():
-                with open(self.config_path, 'r') as f:
-                    configs = json.load(f)
-                    
-                for name, config_data in configs.items():
-                    # Convert datetime string back to datetime object
-                    if 'created_at' in config_data:
-                        config_data['created_at'] = datetime.fromisoformat(config_data['created_at'])
-                    
-                    self.pipelines[name] = PipelineConfig(**config_data)
-                    
-                logger.info(f"Loaded {len(self.pipelines)} pipeline configurations")
+            if self.config_dir.is_dir():
+                configs = {}
+                for path in sorted(self.config_dir.glob('*.json')):
+                    config_data = self._read_json(path)
+                    configs[config_data['name']] = config_data
+                    # Move files saved under an earlier naming scheme to their encoded name
+                    target = self._configuration_path(config_data['name'])
+                    if path.resolve() != target:
+                        os.replace(path, target)
+            elif Path(self.config_path).exists():
+                configs = self._read_json(Path(self.config_path))
+            else:
+                return
+                
+            for name, config_data in configs.items():
+                # Convert datetime string back to datetime object
+                if 'created_at' in config_data:
+                    config_data['created_at'] = datetime.fromisoformat(config_data['created_at'])
+                
+                self.pipelines[name] = PipelineConfig(**config_data)
+                
+            logger.info(f"Loaded {len(self.pipelines)} pipeline configurations")
+            
+            if not self.config_dir.is_dir():
+                self._save_configurations()
         except Exception as e:
             logger.warning(f"Could not load configurations: {str(e)}")
     
     def _save_configurations(self):
-        """Save pipeline configurations to file"""
+        """Save every pipeline configuration to its own file"""
+        for name in self.pipelines:
+            self._save_configuration(name)
+            
+        logger.info(f"Saved {len(self.pipelines)} pipeline configurations")
+    
+    def _save_configuration(self, name: str):
+        """Save one pipeline configuration, replacing its file atomically"""
         try:
-            configs = {}
-            for name, config in self.pipelines.items():
-                config_dict = asdict(config)
-                # Convert datetime to string for JSON serialization
-                if 'created_at' in config_dict:
-                    config_dict['created_at'] = config_dict['created_at'].isoformat()
-                configs[name] = config_dict
+            self.config_dir.mkdir(parents=True, exist_ok=True)
+            path = self._configuration_path(name)
+            tmp_path = path.with_suffix('.json.tmp')
+            with open(tmp_path, 'wb') as f:
+                f.write(self.pipelines[name].to_json_bytes())
             
-            with open(self.config_path, 'w') as f:
-                json.dump(configs, f, indent=2)
-                
-            logger.info(f"Saved {len(self.pipelines)} pipeline configurations")
+            os.replace(tmp_path, path)
         except Exception as e:
-            logger.error(f"Could not save configurations: {str(e)}")
+            logger.error(f"Could not save configuration '{name}': {str(e)}")
+    
+    def _delete_configuration(self, name: str):
+        """Remove the file of a deleted pipeline"""
+        try:
+            self._configuration_path(name).unlink(missing_ok=True)
+        except Exception as e:
+            logger.error(f"Could not delete configuration '{name}': {str(e)}")
+    
+    def _configuration_path(self, name: str) -> Path:
+        """File a pipeline's configuration is saved to, confined to the configuration directory"""
+        # Names are user input: keep a readable slug and tell apart names sharing it by their hash
+        slug = _UNSAFE_FILENAME_RE.sub('_', name).strip('_')[:64] or 'pipeline'
+        digest = hashlib.blake2b(name.encode(), digest_size=8).hexdigest()
+        config_dir = self.config_dir.resolve()
+        path = (config_dir / f"{slug}-{digest}.json").resolve()
+        if path.parent != config_dir:
+            raise ValueError(f"Configuration path for pipeline '{name}' leaves {config_dir}")
+        return path
+    
+    @staticmethod
+    def _read_json(path: Path) -> Any:
+        """Read a JSON file with orjson when available"""
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read()) if orjson else json.load(f)
 
 class DataOpsAPI:
     """REST API interface for DataOps operations"""
@@ -1138,7 +2179,8 @@ class DataOpsAPI:
             data_source=request_data['data_source'],
             pipeline_name=request_data['pipeline_name'],
             framework=request_data.get('framework', 'airflow'),
-            destination_config=request_data.get('destination_config')
+            destination_config=request_data.get('destination_config'),
+            engine=request_data.get('engine', 'pandas')
         )
     
     def validate_data_endpoint(self, request_data: Dict[str, Any]) -> Dict[str, Any]: